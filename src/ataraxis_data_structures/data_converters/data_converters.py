@@ -7,14 +7,65 @@ this allows enforcing customizable type-ranges to otherwise untyped Python conte
 standardization and working with c-types and NumPy.
 """
 
+from math import isfinite
 from types import NoneType
 from typing import Any, Union, Literal, Iterable, Optional
+from contextlib import suppress
 
 import numpy as np
 from numpy.typing import NDArray
 from ataraxis_base_utilities import console, ensure_list
 
 
+def _verify_boolean_arguments(class_name: str, arguments: dict[str, Any]) -> None:
+    """Verifies that all input class initialization arguments are booleans.
+
+    This is a service function used by all converter classes to verify their boolean initialization arguments. Since
+    bool cannot be subclassed, the function uses exact type checks, which are faster than isinstance() checks.
+
+    Args:
+        class_name: The name of the initialized class, used in the error message.
+        arguments: The dictionary that maps the names of the verified arguments to their values.
+
+    Raises:
+        TypeError: If any of the input arguments is not a boolean.
+    """
+    for name, value in arguments.items():
+        if type(value) is not bool:
+            message = (
+                f"Unable to initialize {class_name} class instance. Expected a boolean {name} argument value, but "
+                f"encountered {value} of type {type(value).__name__}."
+            )
+            console.error(message=message, error=TypeError)
+
+
+# Stores the Python scalar types that are wrapped into one-element lists by the _ensure_list() function.
+_scalar_types: frozenset[type] = frozenset({int, float, bool, str, NoneType})
+
+
+def _ensure_list(value: Any) -> list[Any]:
+    """Ensures that the input value is returned as a list.
+
+    This is a thin wrapper over the ensure_list() function from the ataraxis-base-utilities library that resolves the
+    most common inputs processed by converter classes (lists, tuples and Python scalars) using exact type checks. All
+    other inputs, such as numpy arrays and scalars, are forwarded to the ensure_list() function.
+
+    Args:
+        value: The value to be converted into / preserved as a Python list.
+
+    Returns:
+        A Python list that contains the input value data.
+    """
+    value_type = type(value)
+    if value_type is list:
+        return value
+    if value_type is tuple:
+        return list(value)
+    if value_type in _scalar_types:
+        return [value]
+    return ensure_list(value)
+
+
 class NumericConverter:
     """A factory-like class for validating and converting numeric values based on a predefined configuration.
 
@@ -43,6 +94,10 @@ class NumericConverter:
         _upper_limit: Optional. An integer or float that specifies the upper limit for numeric value
             verification. Verified integers and floats that are larger than the limit number will be considered invalid.
             Set to None to disable upper-limit.
+        _lower_bound: The lower limit used during value validation. Unlike _lower_limit, this is set to negative
+            infinity if the lower limit is disabled, so that validation does not need to check whether the limit is set.
+        _upper_bound: Same as _lower_bound, but for the upper limit. Set to positive infinity if the upper limit is
+            disabled.
         _parse_strings: Determines whether to attempt validating strings as number types (with necessary conversions).
         _allow_int: Determines whether the class can validate and convert inputs into integer values.
         _allow_float: Determines whether the class can validate and convert inputs into float values.
@@ -53,6 +108,21 @@ class NumericConverter:
             not None. If both integer and float outputs are not allowed.
     """
 
+    # Stores instance attributes in fixed slots instead of a per-instance dictionary. This reduces the memory used by
+    # each instance and speeds up attribute access during validation.
+    __slots__ = (
+        "_allow_float",
+        "_allow_int",
+        "_lower_bound",
+        "_lower_limit",
+        "_parse_strings",
+        "_upper_bound",
+        "_upper_limit",
+    )
+
+    # The largest magnitude up to which float values represent all integers exactly (2**53).
+    _exact_float_limit: float = 9007199254740992.0
+
     def __init__(
         self,
         number_lower_limit: Optional[Union[int, float]] = None,
@@ -63,24 +133,14 @@ class NumericConverter:
         allow_float_output: bool = True,
     ) -> None:
         # Verifies that initialization arguments are valid:
-        if not isinstance(parse_number_strings, bool):
-            message = (
-                f"Unable to initialize NumericConverter class instance. Expected a boolean parse_number_strings "
-                f"argument value, but encountered {parse_number_strings} of type {type(parse_number_strings).__name__}."
-            )
-            console.error(message=message, error=TypeError)
-        if not isinstance(allow_integer_output, bool):
-            message = (
-                f"Unable to initialize NumericConverter class instance. Expected a boolean allow_integer_output "
-                f"argument value, but encountered {allow_integer_output} of type {type(allow_integer_output).__name__}."
-            )
-            console.error(message=message, error=TypeError)
-        if not isinstance(allow_float_output, bool):
-            message = (
-                f"Unable to initialize NumericConverter class instance. Expected a boolean allow_float_output "
-                f"argument value, but encountered {allow_float_output} of type {type(allow_float_output).__name__}."
-            )
-            console.error(message=message, error=TypeError)
+        _verify_boolean_arguments(
+            class_name="NumericConverter",
+            arguments={
+                "parse_number_strings": parse_number_strings,
+                "allow_integer_output": allow_integer_output,
+                "allow_float_output": allow_float_output,
+            },
+        )
         if not isinstance(number_lower_limit, (int, float, NoneType)):
             message = (
                 f"Unable to initialize NumericConverter class instance. Expected an integer, float or NoneType "
@@ -125,6 +185,11 @@ class NumericConverter:
         self._lower_limit = number_lower_limit
         self._upper_limit = number_upper_limit
 
+        # Resolves the bounds used during validation. Disabled limits are replaced with infinities, which all numbers
+        # satisfy.
+        self._lower_bound: int | float = -np.inf if number_lower_limit is None else number_lower_limit
+        self._upper_bound: int | float = np.inf if number_upper_limit is None else number_upper_limit
+
     def __repr__(self) -> str:
         """Returns a string representation of the NumericConverter instance."""
         representation_string = (
@@ -183,51 +248,128 @@ class NumericConverter:
             The validated and converted number, either as a float or integer, if conversion succeeds. None, if
             conversion fails for any reason.
         """
-        # Filters out any types that are definitely not integer or float convertible.
-        if not isinstance(value, (int, str, bool, float)):
-            return None
-
-        # Converts strings to floats if this is allowed.
-        if isinstance(value, str) and self._parse_strings:
-            try:
+        # Resolves the input type with identity checks against the builtin types, which are the most common inputs. The
+        # slower isinstance() checks are only used for the subclasses of these types, such as numpy scalars.
+        value_type = type(value)
+        if value_type is not int and value_type is not float:
+            # Converts booleans to floats (they already are integers, strictly speaking)
+            if value_type is bool:
                 value = float(value)
-            except Exception:
-                return None
 
-        # Converts booleans to integers (they already are integers, strictly speaking)
-        if isinstance(value, bool):
-            value = float(value)
+            # Converts strings to floats if this is allowed.
+            elif isinstance(value, str):
+                if not self._parse_strings:
+                    return None
+                try:
+                    value = float(value)
+                except Exception:
+                    return None
 
-        # If the input value is not converted to int or float by this point, then it cannot be validated.
-        if not isinstance(value, (int, float)):
-            return None
+            # Filters out any types that are definitely not integer or float convertible.
+            elif not isinstance(value, (int, float)):
+                return None
 
         # Validates the type of the value, making the necessary and allowed conversions, if possible, to pass this step.
-        if isinstance(value, int) and not self._allow_int:
+        if isinstance(value, float):
+            # If the value is a float, floats are not allowed, and value is integer-convertible without data-loss,
+            # converts it to an integer. Note, if floats are not allowed, integers are always allowed, as the class
+            # requires at least one output type to be enabled.
+            if not self._allow_float:
+                # Converts the value and compares the result to the original value. This avoids calling is_integer()
+                # before converting the value. Within the range where floats represent all integers exactly (±2**53),
+                # the comparison detects values that are not integer-convertible without data loss. Floats outside the
+                # exact range are always integers, unless they are infinite or NaN (NaNs fail all range comparisons).
+                # Such values are not converted, and the None placeholder fails the comparison.
+                limit = self._exact_float_limit
+                integer = int(value) if -limit <= value <= limit or isfinite(value) else None
+                if integer != value:
+                    return None
+                value = integer
+
+        elif not self._allow_int:
             # If the value is an integer, integers are not allowed, but floats are allowed, converts the value to float.
             # Relies on the fact that any integer is float-convertible.
             value = float(value)
 
-        elif isinstance(value, float) and not self._allow_float:
-            # If the value is a float, floats are not allowed, integers are allowed, and value is integer-convertible
-            # without data-loss, converts it to an integer.
-
-            if value.is_integer() and self._allow_int:
-                value = int(value)
-            # If the value is a float, floats are not allowed, and either integers are not allowed or the value is not
-            # integer-convertible without data loss, returns None.
-            else:
-                return None
-
-        # Validates that the value is in the specified range if any is provided.
-        if (self._lower_limit is not None and value < self._lower_limit) or (
-            self._upper_limit is not None and value > self._upper_limit
-        ):
+        # Validates that the value is in the specified range. Disabled limits use infinite bounds, which always pass.
+        if value < self._lower_bound or value > self._upper_bound:
             return None
 
         # Returns the validated (and, potentially, converted) value.
         return value
 
+    def validate_array(self, values: list[Any] | tuple[Any, ...] | NDArray[Any]) -> NDArray[np.float64]:
+        """Validates all input values at the same time, marking the values that fail validation with NaN.
+
+        This method validates each value as if it was passed to the validate_value() method as a Python object, but
+        processes numeric numpy arrays (and collections of numbers) with vectorized numpy operations instead of
+        validating each value separately. This is considerably faster for large collections of numeric values.
+        Collections that contain non-numeric values, such as strings, are validated element-wise, using the
+        validate_value() method.
+
+        Notes:
+            Since the method uses NaN to mark invalid values, the output array always uses the float64 datatype, even
+            if the class is configured to only output integers. In that case, all valid values are integer-convertible
+            without data loss.
+
+            The results differ from calling validate_value() on each value in the following cases:
+            - The elements of numpy arrays are validated as their Python equivalents (as returned by the array tolist()
+              method). Therefore, the elements of numeric numpy integer arrays are valid, although the validate_value()
+              method rejects numpy integer scalars.
+            - Integers are returned as float64 values, so integers outside the ±2**53 range, where floats represent all
+              integers exactly, are rounded to the nearest representable float64 value.
+
+        Args:
+            values: The numpy array or the one-dimensional list or tuple of values to validate. Numpy arrays can have
+                any shape.
+
+        Returns:
+            The float64 numpy array with the same shape as the input array, which stores the validated values. The
+            values that failed validation are replaced with NaN.
+
+        Raises:
+            TypeError: If the input values are not stored in a numpy array, list or tuple.
+        """
+        # Other iterables (such as generators) cannot be converted to numpy arrays of their values.
+        if not isinstance(values, (np.ndarray, list, tuple)):
+            message = (
+                f"Unable to validate the input values using the NumericConverter class instance. Expected a numpy "
+                f"array, list or tuple of values, but encountered {values} of type {type(values).__name__}."
+            )
+            console.error(message=message, error=TypeError)
+
+        array = np.asarray(values)
+
+        # Collections that contain non-numeric values are processed element-wise. Non-array collections are iterated
+        # directly, as numpy may coerce mixed-type collections to strings (e.g.: [1, 'a'] -> ['1', 'a']).
+        if array.dtype.kind not in "biuf":
+            items = array.ravel().tolist() if isinstance(values, np.ndarray) else values
+            results = [self.validate_value(value) for value in items]
+            return np.array([np.nan if result is None else result for result in results], dtype=np.float64).reshape(
+                array.shape
+            )
+
+        # Casting always produces a new array, which is then safe to modify in-place.
+        array = array.astype(np.float64)
+
+        # Builds the mask of valid values. If float outputs are not allowed, only integer-convertible values are valid.
+        # All comparisons write their results into the preallocated mask buffers, instead of allocating a new boolean
+        # array for each check.
+        valid = np.ones(array.shape, dtype=np.bool_)
+        check = np.empty(array.shape, dtype=np.bool_)
+        if not self._allow_float:
+            np.equal(np.mod(array, 1), 0, out=valid)
+        if self._lower_limit is not None:
+            np.greater_equal(array, self._lower_limit, out=check)
+            valid &= check
+        if self._upper_limit is not None:
+            np.less_equal(array, self._upper_limit, out=check)
+            valid &= check
+
+        # Replaces invalid values with NaN in-place.
+        np.copyto(array, np.nan, where=np.logical_not(valid, out=valid))
+        return array
+
 
 class BooleanConverter:
     """A factory-like class for validating and converting boolean values based on a predefined configuration.
@@ -246,23 +388,27 @@ class BooleanConverter:
             boolean-equivalent parsing is allowed, these values will be converted to and recognized as valid boolean
             True values.
         _false_equivalents: Same as true_equivalents, but for boolean False equivalents.
+        _bool_equivalents: Maps each true and false equivalent to the boolean value it represents. This allows
+            resolving boolean-equivalents with a single dictionary lookup.
 
     Raises:
         TypeError: If the input parse_boolean_equivalents argument is not a boolean.
     """
 
-    _true_equivalents: set[str | int | float] = {"True", "true", 1, "1", 1.0}
-    _false_equivalents: set[str | int | float] = {"False", "false", 0, "0", 0.0}
+    __slots__ = ("_parse_bool_equivalents",)
+
+    _true_equivalents: frozenset[str | int | float] = frozenset({"True", "true", 1, "1", 1.0})
+    _false_equivalents: frozenset[str | int | float] = frozenset({"False", "false", 0, "0", 0.0})
+    _bool_equivalents: dict[str | int | float, bool] = {
+        **dict.fromkeys(_true_equivalents, True),
+        **dict.fromkeys(_false_equivalents, False),
+    }
 
     def __init__(self, *, parse_boolean_equivalents: bool = True) -> None:
         # Verifies that initialization arguments are valid:
-        if not isinstance(parse_boolean_equivalents, bool):
-            message = (
-                f"Unable to initialize BooleanConverter class instance. Expected a boolean parse_boolean_equivalents "
-                f"argument value, but encountered {parse_boolean_equivalents} of "
-                f"type {type(parse_boolean_equivalents).__name__}."
-            )
-            console.error(message=message, error=TypeError)
+        _verify_boolean_arguments(
+            class_name="BooleanConverter", arguments={"parse_boolean_equivalents": parse_boolean_equivalents}
+        )
 
         self._parse_bool_equivalents = parse_boolean_equivalents
 
@@ -276,6 +422,16 @@ class BooleanConverter:
         """Returns True if the class is configured to parse boolean equivalents as boolean values."""
         return self._parse_bool_equivalents
 
+    @classmethod
+    def boolean_equivalents(cls) -> tuple[str | int | float, ...]:
+        """Returns the values recognized as boolean equivalents when the class is configured to parse boolean
+        equivalents.
+
+        The values are sorted by their type name and then by their string representation, so that the returned order
+        does not depend on the (randomized) iteration order of the equivalents sets.
+        """
+        return tuple(sorted(cls._bool_equivalents, key=lambda value: (type(value).__name__, str(value))))
+
     def validate_value(self, value: bool | str | int | float | None) -> bool | None:
         """Ensures that the input value is a valid boolean.
 
@@ -293,20 +449,19 @@ class BooleanConverter:
         Returns:
             The validated and converted boolean value, if conversion succeeds. None, if conversion fails for any reason.
         """
-        # If the input is a boolean type returns it to caller unchanged
-        if isinstance(value, bool):
+        # If the input is a boolean type returns it to caller unchanged. Since bool cannot be subclassed, the exact type
+        # check is equivalent to (and faster than) isinstance().
+        if type(value) is bool:
             return value
 
-        # Otherwise, if the value is a boolean-equivalent string or number and parsing boolean-equivalents is allowed,
-        # converts it to boolean True or False and returns it to caller
-        if self.parse_boolean_equivalents and isinstance(value, (str, int, float)):
-            # If the value is in the set of true equivalents, returns True.
-            if value in self._true_equivalents:
-                return True
-            # If the value is in the set of false equivalents, returns False.
-            elif value in self._false_equivalents:
-                return False
-        # If the value is not in the list of true or false equivalents, returns None.
+        # Otherwise, if the value is a string or number and parsing boolean-equivalents is allowed, looks the value up
+        # in the boolean-equivalents map. This returns True or False for boolean-equivalent values and None for any
+        # other value. The type check ensures that unhashable inputs (lists, dictionaries, etc.) are never used as
+        # lookup keys.
+        if self._parse_bool_equivalents and isinstance(value, (str, int, float)):
+            return self._bool_equivalents.get(value)
+
+        # If parsing is disabled or the value is not a string or number, returns None.
         return None
 
 
@@ -330,17 +485,15 @@ class NoneConverter:
         TypeError: If the input parse_none_equivalents argument is not a boolean.
     """
 
-    _none_equivalents: set[str] = {"None", "none", "Null", "null"}
+    __slots__ = ("_parse_none_equivalents",)
+
+    _none_equivalents: frozenset[str] = frozenset({"None", "none", "Null", "null"})
 
     def __init__(self, *, parse_none_equivalents: bool = True) -> None:
         # Verifies that initialization arguments are valid:
-        if not isinstance(parse_none_equivalents, bool):
-            message = (
-                f"Unable to initialize NoneConverter class instance. Expected a boolean parse_none_equivalents "
-                f"argument value, but encountered {parse_none_equivalents} of "
-                f"type {type(parse_none_equivalents).__name__}."
-            )
-            console.error(message=message, error=TypeError)
+        _verify_boolean_arguments(
+            class_name="NoneConverter", arguments={"parse_none_equivalents": parse_none_equivalents}
+        )
 
         self._parse_none_equivalents = parse_none_equivalents
 
@@ -354,6 +507,13 @@ class NoneConverter:
         """Returns True if the class is configured to parse None-equivalent inputs as None values."""
         return self._parse_none_equivalents
 
+    @classmethod
+    def none_equivalents(cls) -> tuple[str, ...]:
+        """Returns the strings recognized as None equivalents when the class is configured to parse None
+        equivalents.
+        """
+        return tuple(sorted(cls._none_equivalents))
+
     def validate_value(self, value: Any) -> None | str:
         """Ensures that the input value is a valid NoneType (None).
 
@@ -380,9 +540,10 @@ class NoneConverter:
         if value is None:
             return None
 
-        # If the input is a pythonic-None-equivalent string and the validator is configured to parse none-equivalent
-        # strings, returns None
-        elif value in self._none_equivalents and self.parse_none_equivalents:
+        # If the validator is configured to parse none-equivalent strings and the input is a pythonic-None-equivalent
+        # string, returns None. The cheap flag and type checks are evaluated first, so that the set lookup is only
+        # carried out for string inputs.
+        elif self._parse_none_equivalents and isinstance(value, str) and value in self._none_equivalents:
             return None
 
         # If the value is not in the set of None equivalents, returns the string 'None' to indicate validation failure.
@@ -415,6 +576,11 @@ class StringConverter:
     Attributes:
         _string_options: Optional. A tuple or list of string-options. If provided, all validated strings will be
             checked against the input iterable and only considered valid if the string matches one of the options.
+        _string_option_set: Optional. Stores the lower-case string-options as a frozenset, which is used to check
+            validated strings against the options with a single hash lookup. Set to None if option-checking is disabled.
+        _lower_input: Determines whether validated strings have to be converted to lower-case, either to check them
+            against the string-options or to return them as lower-case strings. This is resolved once, at
+            initialization, to avoid re-evaluating the configuration for each validated value.
         _string_force_lower: Determines if validated string values have to be converted to lower-case.
         _allow_string_conversion: Determines whether to convert non-string inputs to strings. Setting this to true is
             fairly dangerous, as almost anything can be converted to a string.
@@ -425,6 +591,14 @@ class StringConverter:
         ValueError: If the string_options argument is empty iterable.
     """
 
+    __slots__ = (
+        "_allow_string_conversion",
+        "_lower_input",
+        "_string_force_lower",
+        "_string_option_set",
+        "_string_options",
+    )
+
     def __init__(
         self,
         string_options: Optional[Union[list[str], tuple[str]]] = None,
@@ -433,19 +607,10 @@ class StringConverter:
         string_force_lower: bool = False,
     ):
         # Verifies that initialization arguments are valid:
-        if not isinstance(allow_string_conversion, bool):
-            message = (
-                f"Unable to initialize StringConverter class instance. Expected a boolean allow_string_conversion "
-                f"argument value, but encountered {allow_string_conversion} of type "
-                f"{type(allow_string_conversion).__name__}."
-            )
-            console.error(message=message, error=TypeError)
-        if not isinstance(string_force_lower, bool):
-            message = (
-                f"Unable to initialize StringConverter class instance. Expected a boolean string_force_lower "
-                f"argument value, but encountered {string_force_lower} of type {type(string_force_lower).__name__}."
-            )
-            console.error(message=message, error=TypeError)
+        _verify_boolean_arguments(
+            class_name="StringConverter",
+            arguments={"allow_string_conversion": allow_string_conversion, "string_force_lower": string_force_lower},
+        )
         if not isinstance(string_options, (tuple, list, NoneType)):
             message = (
                 f"Unable to initialize StringConverter class instance. Expected a None, tuple, or list string_options "
@@ -481,6 +646,10 @@ class StringConverter:
         self._allow_string_conversion = allow_string_conversion
         self._string_force_lower = string_force_lower
         self._string_options = string_options
+        self._string_option_set: Optional[frozenset[str]] = (
+            frozenset(string_options) if string_options is not None else None
+        )
+        self._lower_input: bool = string_force_lower or string_options is not None
 
     def __repr__(self) -> str:
         """Returns a string representation of the StringConverter instance."""
@@ -533,31 +702,33 @@ class StringConverter:
 
         # Ensures that the input variable is a string, otherwise returns None to indicate check failure. If the variable
         # is originally not a string, but string-conversions are allowed, attempts to convert it to string, but returns
-        # None if the conversion fails (unlikely)
-        if not isinstance(value, str) and not self.allow_string_conversion:
-            return None
-        else:
+        # None if the conversion fails (unlikely). String subclasses are also converted to plain strings.
+        if type(value) is not str:
+            if not isinstance(value, str) and not self._allow_string_conversion:
+                return None
             value = str(value)
 
-        # If needed, converts the checked value to the lower case. This is done if the class is configured to evaluate
-        # the string against a list or tuple of options. The value can still be returned as non-lower-converted string,
-        # depending on the 'string_force_lower' attribute value.
-        value_lower = value.lower() if self._string_force_lower or self._string_options is not None else value
-
-        # If option-limiting is enabled, validates the value against the iterable of options
-        if self._string_options is not None and value_lower in self._string_options:
-            # If the validator is configured to convert strings to the lower case, returns lower-case string
-            if self.string_force_lower:
-                return value_lower
-            # Otherwise returns the original input string without alteration
-            else:
-                return value
-        elif self._string_options is None:
-            # If option-limiting is not enabled, returns the string value. Converts it to the lower case if requested.
+        # If the class is not configured to evaluate the string against a list or tuple of options or to convert it to
+        # the lower case, returns the string as-is.
+        if not self._lower_input:
+            return value
+
+        # Otherwise, converts the checked value to the lower case. The value can still be returned as
+        # non-lower-converted string, depending on the 'string_force_lower' attribute value.
+        value_lower = value.lower()
+
+        # If option-limiting is not enabled, returns the lower-case string value.
+        if self._string_option_set is None:
             return value_lower
-        else:
-            # If the value is not in the options' iterable or if the options, returns None to indicate check failure.
-            return None
+
+        # If option-limiting is enabled, validates the value against the set of (lower-case) options
+        if value_lower in self._string_option_set:
+            # If the validator is configured to convert strings to the lower case, returns lower-case string. Otherwise
+            # returns the original input string without alteration
+            return value_lower if self._string_force_lower else value
+
+        # If the value is not in the options' set, returns None to indicate check failure.
+        return None
 
 
 class PythonDataConverter:
@@ -618,6 +789,13 @@ class PythonDataConverter:
             an input fails validation.
         _allowed_outputs: A set that stores all output types that are supported by the current class configuration.
         _supported_iterables: A dictionary that maps supported output iterable keys to callable types.
+        _literal_results: Stores the validation results for the boolean and None equivalent literals ('True', 'null',
+            '1', etc.). These results are computed at initialization and are never evicted.
+        _string_results: Caches the validation results for all other string inputs. Configuration classes typically
+            validate the same strings many times, and strings are the most expensive inputs to validate, as each
+            converter has to parse them.
+        _string_cache_size: The maximum number of string validation results stored in the _string_results cache. When
+            the cache is full, the oldest cached result is evicted before caching the next result.
 
     Raises:
         TypeError: If any of the input arguments are not of the expected type.
@@ -625,6 +803,7 @@ class PythonDataConverter:
     """
 
     _supported_iterables = {"tuple": tuple, "list": list}
+    _string_cache_size: int = 512
 
     def __init__(
         self,
@@ -666,20 +845,10 @@ class PythonDataConverter:
                 f"encountered {string_converter} of type {type(string_converter).__name__}."
             )
             console.error(message=message, error=TypeError)
-        if not isinstance(filter_failed_elements, bool):
-            message = (
-                f"Unable to initialize PythonDataConverter class instance. Expected a boolean filter_failed_elements "
-                f"argument value, but encountered {filter_failed_elements} of "
-                f"type {type(filter_failed_elements).__name__}."
-            )
-            console.error(message=message, error=TypeError)
-        if not isinstance(raise_errors, bool):
-            message = (
-                f"Unable to initialize PythonDataConverter class instance. Expected a boolean raise_errors "
-                f"argument value, but encountered {raise_errors} of "
-                f"type {type(raise_errors).__name__}."
-            )
-            console.error(message=message, error=TypeError)
+        _verify_boolean_arguments(
+            class_name="PythonDataConverter",
+            arguments={"filter_failed_elements": filter_failed_elements, "raise_errors": raise_errors},
+        )
         if iterable_output_type is not None and iterable_output_type not in self._supported_iterables.keys():
             message = (
                 f"Unsupported output iterable type {iterable_output_type} requested when initializing "
@@ -721,6 +890,16 @@ class PythonDataConverter:
         self._iterable_output_type: Optional[Literal["tuple", "list"]] = iterable_output_type
         self._filter_failed_elements: bool = filter_failed_elements
         self._raise_errors: bool = raise_errors
+        self._string_results: dict[str, tuple[bool, int | float | str | bool | None]] = {}
+
+        # Resolves the boolean and None equivalent literals ('True', 'null', '1', etc.), which are the most common
+        # strings encountered in configuration files. These results are kept separate from the bounded string cache, so
+        # that the literals are always resolved with a single dictionary lookup, regardless of how many other distinct
+        # strings are validated by the instance.
+        self._literal_results: dict[str, tuple[bool, int | float | str | bool | None]] = {}
+        for literal in BooleanConverter.boolean_equivalents() + NoneConverter.none_equivalents():
+            if type(literal) is str:
+                self._literal_results[literal] = self._apply_converters(literal)
 
     def __repr__(self) -> str:
         """Returns a string representation of the PythonDataConverter class instance."""
@@ -847,6 +1026,39 @@ class PythonDataConverter:
         # failure code
         return False, None
 
+    def _apply_converters_cached(self, value: Any) -> tuple[bool, int | float | str | bool | None]:
+        """Hierarchically applies each of the converters to the input scalar value, reusing the cached results for
+        previously validated strings.
+
+        Only the results for (exact) string inputs are cached. Since the converters cannot be reconfigured, the result
+        for the same string never changes. Other inputs are either cheap to validate or cannot be safely used as
+        cache keys (e.g.: 0.0 and -0.0 are equal, but may produce different outputs).
+
+        Args:
+            value: The value to be validated and / or converted.
+
+        Returns: A tuple that contains two values. The first is a boolean that indicates if the returned value passed
+            or failed validation. The second is either the validated / converted value or a None placeholder.
+        """
+        if type(value) is not str:
+            return self._apply_converters(value)
+
+        result = self._literal_results.get(value)
+        if result is None:
+            result = self._string_results.get(value)
+        if result is None:
+            result = self._apply_converters(value)
+
+            # Keeps the cache size bounded by evicting the oldest cached result. Since dictionaries preserve the
+            # insertion order, the first key is always the oldest one. Note, the instance can be shared by multiple
+            # threads, so another thread may evict the same key between the lookup and the removal, or modify the
+            # cache while its first key is being resolved. In both cases, the eviction is skipped or has no effect.
+            if len(self._string_results) >= self._string_cache_size:
+                with suppress(RuntimeError):
+                    self._string_results.pop(next(iter(self._string_results), None), None)  # type: ignore[arg-type]
+            self._string_results[value] = result
+        return result
+
     def validate_value(
         self,
         value_to_validate: Any,
@@ -876,11 +1088,21 @@ class PythonDataConverter:
             ValueError: If the val;ue to validate is iterable with multiple dimensions. If the input scalar value or
                 any element of an iterable value cannot be validated, and the raise_errors attribute is set to True.
         """
+        # Scalar inputs that pass validation are returned directly, without being wrapped into a list. Scalars that
+        # fail validation are processed below, together with iterable inputs, to apply the class filtering / error
+        # configuration.
+        if type(value_to_validate) in _scalar_types:
+            success, output_value = self._apply_converters_cached(value_to_validate)
+            if success:
+                return output_value
+
         # Converts the input value to a list
-        list_value: list[int | float | str | bool | None] = ensure_list(value_to_validate)
+        list_value: list[int | float | str | bool | None] = _ensure_list(value_to_validate)
 
+        # Evaluates the cheap scalar type check first, so that the (comparatively slow) abstract Iterable check only
+        # runs for non-scalar elements.
         for num, element in enumerate(list_value):
-            if isinstance(element, Iterable) and not isinstance(element, (bool, NoneType, int, float, str)):
+            if not isinstance(element, (bool, NoneType, int, float, str)) and isinstance(element, Iterable):
                 message = (
                     f"Unable to validate the input collection of values ({list_value}). Currently, this method only "
                     f"supports one-dimensional iterable inputs. Instead, a sub-iterable was discovered when "
@@ -888,18 +1110,49 @@ class PythonDataConverter:
                 )
                 console.error(message=message, error=ValueError)
 
-        # Uses list-comprehension to call _apply_converters method on each of the values in the list. This generates a
-        # list of two-element tuples
-        output_iterable: list[tuple[bool, int | float | str | bool | None]] = [
-            self._apply_converters(value) for value in list_value
-        ]
+        return self.validate_list(list_value)
+
+    def validate_list(
+        self,
+        list_value: list[Any],
+    ) -> int | float | bool | None | str | list[int | float | bool | str | None] | tuple[int | float | str | None, ...]:
+        """Validates the elements of the input one-dimensional list and converts them to the preferred datatype.
+
+        This method contains the core iterable-processing logic of the validate_value() method. Unlike
+        validate_value(), it does not check the input list for sub-iterables and expects the caller to ensure that the
+        list is one-dimensional. Use it instead of validate_value() when processing inputs that are known to be
+        one-dimensional lists of scalars, such as the lists produced from one-dimensional numpy arrays, to skip the
+        sub-iterable check.
 
-        # Loops over the tuple-elements of the output_iterables and the original input value(s) and handles them
-        # according to the class filtering / error configuration
+        Args:
+            list_value: The one-dimensional list of values to be validated and converted.
+
+        Returns:
+            The validated and converted value(s), processed according to the class configuration. See the
+            validate_value() method for details.
+
+        Raises:
+            ValueError: If any element of the input list cannot be validated, and the raise_errors attribute is set to
+                True.
+        """
+        # Validates each of the input values and handles the validation results according to the class filtering /
+        # error configuration. Validation and result handling are carried out in a single pass over the input values,
+        # so no intermediate collection of validation results is created. The configuration flags are constant for the
+        # duration of the loop, so they are resolved once instead of for every processed element.
+        apply_converters = self._apply_converters_cached
+        raise_errors = self._raise_errors
+        filter_failed = self._filter_failed_elements
         final_result: list[int | float | str | bool | None] = []  # This is the list that will be returned to caller
-        for (success, output_value), input_value in zip(output_iterable, list_value):
+        append = final_result.append
+        for input_value in list_value:
+            success, output_value = apply_converters(input_value)
+
+            # if the value passed validation, appends it to the output list as-is
+            if success:
+                append(output_value)
+
             # If the evaluated element has failed validation and errors are to be raised, raises a ValueError
-            if not success and self.raise_errors:
+            elif raise_errors:
                 message = (
                     f"Unable to validate the input value ({input_value}). The class is configured to conditionally "
                     f"return the following types: {self.allowed_output_types}. This means that the input value is "
@@ -911,19 +1164,10 @@ class PythonDataConverter:
                 # Fallback to appease mypy, should not be reachable
                 raise ValueError(message)  # pragma: no cover
 
-            # Otherwise, if the evaluated element has failed validation and failed elements are to be filtered, skips
-            # adding it to the result list:
-            elif not success and self.filter_failed:
-                continue
-
             # If filtering is disabled, appends "Validation/ConversionError" string to the output list in place of the
-            # value that failed validation
-            elif not success:
-                final_result.append("Validation/ConversionError")
-
-            # if the value passed validation, appends it to the output list as-is
-            else:
-                final_result.append(output_value)
+            # value that failed validation. Otherwise, skips adding the failed value to the result list.
+            elif not filter_failed:
+                append("Validation/ConversionError")
 
         # If the length of the result list is 1, pops out the only element and returns it as a scalar
         if len(final_result) == 1:
@@ -935,11 +1179,7 @@ class PythonDataConverter:
 
         # For iterable outputs, determines and returns it either as a tuple or a list, depending on what was requested.
         # Defaults to tuples if the user did not explicitly request a particular output type.
-        return (
-            tuple(final_result)
-            if self.iterable_output_type == "tuple" or self.iterable_output_type is None
-            else final_result
-        )
+        return final_result if self._iterable_output_type == "list" else tuple(final_result)
 
 
 class NumpyDataConverter:
@@ -982,7 +1222,13 @@ class NumpyDataConverter:
             the 'types' lists to retrieve the callable datatype. This is used to access the callable datatypes used for
             python to numpy conversion based on teh class configuration.
         _floating_index_map: Same as _integer_index_map, but for floating point numpy datatypes.
+        _bit_length_index_map: Maps the number of bits required to represent an integer value to the index of the
+            integer datatype with the minimum bit-width that can represent the value.
         _supported_output_bit_widths: Stores supported output_bit_width argument values as a set.
+        _integer_datatype: The integer numpy datatype (and its limits) used for fixed bit-width conversions. Resolved
+            at initialization based on the output bit-width and the signed / unsigned type. None for 'auto' bit-width.
+        _floating_datatype: Same as _integer_datatype, but for floating point numpy datatypes. Also None if the
+            requested bit-width is not supported by floating point datatypes.
 
     Raises:
         TypeError: If any class arguments are not of the expected types.
@@ -1006,11 +1252,13 @@ class NumpyDataConverter:
         (np.uint64, 0, 2**64 - 1),
     ]
     # Maps different numpy floating datatypes to ranges of values they can support without overflowing. This
-    # is used to automatically resolve the datatype with the minimum bit-width to represent the value.
-    _float_types: list[tuple[type, np.floating[Any], np.floating[Any]]] = [
-        (np.float16, np.finfo(np.float16).min, np.finfo(np.float16).max),
-        (np.float32, np.finfo(np.float32).min, np.finfo(np.float32).max),
-        (np.float64, np.finfo(np.float64).min, np.finfo(np.float64).max),
+    # is used to automatically resolve the datatype with the minimum bit-width to represent the value. The limits are
+    # stored as Python floats, as comparing Python floats to numpy scalars is slower and issues RuntimeWarnings for
+    # values that overflow the numpy scalar type.
+    _float_types: list[tuple[type, float, float]] = [
+        (np.float16, float(np.finfo(np.float16).min), float(np.finfo(np.float16).max)),
+        (np.float32, float(np.finfo(np.float32).min), float(np.finfo(np.float32).max)),
+        (np.float64, float(np.finfo(np.float64).min), float(np.finfo(np.float64).max)),
     ]
 
     # Maps supported bit-width to retrival indices that can be used to index the appropriate callable numpy type
@@ -1018,6 +1266,13 @@ class NumpyDataConverter:
     _integer_index_map: dict[int, int] = {8: 0, 16: 1, 32: 2, 64: 3}
     _floating_index_map: dict[int, int] = {16: 0, 32: 1, 64: 2}
 
+    # Maps the number of bits required to represent an integer value (0 to 64) to the index of the integer datatype
+    # with the minimum bit-width that can store these bits. This is used to resolve the integer datatype with a single
+    # lookup instead of checking the value against the limits of each datatype.
+    _bit_length_index_map: tuple[int, ...] = tuple(
+        0 if bits <= 8 else 1 if bits <= 16 else 2 if bits <= 32 else 3 for bits in range(65)
+    )
+
     # Stores supported output_bit_width argument values as a set for efficient lookup.
     _supported_output_bit_widths: set[int | str] = {8, 16, 32, 64, "auto"}
 
@@ -1085,6 +1340,17 @@ class NumpyDataConverter:
         self._python_converter = python_converter
         self._output_bit_width = output_bit_width
 
+        # Since the class cannot be reconfigured after initialization, resolves the datatypes used for fixed
+        # bit-width integer and floating conversions once, instead of doing this for each converted value. For 'auto'
+        # bit-width and for bit-widths not supported by floating datatypes, the corresponding datatype is set to None.
+        self._integer_datatype: tuple[type, int, int] | None = None
+        self._floating_datatype: tuple[type, float, float] | None = None
+        if output_bit_width in self._integer_index_map:
+            datatypes_list = self._signed_types if signed else self._unsigned_types
+            self._integer_datatype = datatypes_list[self._integer_index_map[output_bit_width]]  # type: ignore
+        if output_bit_width in self._floating_index_map:
+            self._floating_datatype = self._float_types[self._floating_index_map[output_bit_width]]  # type: ignore
+
     def __repr__(self) -> str:
         """Returns a string representation of the NumpyDataConverter instance."""
         return (
@@ -1149,14 +1415,19 @@ class NumpyDataConverter:
                 datatype bit-widths.
         """
         if isinstance(value, int):
-            # Selects the appropriate datatype list based on whether the value needs to be signed or unsigned after
-            # conversion.
-            datatypes_list = self._signed_types if self._signed else self._unsigned_types
+            # Determines the number of bits required to represent the value using the requested signed or unsigned
+            # type. For signed types, this includes the sign bit. Negative values cannot be represented by unsigned
+            # types, which is communicated by setting the required number of bits above the supported maximum.
+            if self._signed:
+                datatypes_list = self._signed_types
+                bit_length = (value if value >= 0 else ~value).bit_length() + 1
+            else:
+                datatypes_list = self._unsigned_types
+                bit_length = value.bit_length() if value >= 0 else 65
 
-            # Finds the datatype with the smallest bit-width that can accommodate the value and returns it to caller
-            for datatype, minimum_value, maximum_value in datatypes_list:
-                if minimum_value <= value <= maximum_value:
-                    return datatype
+            # Resolves the datatype with the smallest bit-width that can accommodate the value and returns it to caller
+            if bit_length <= 64:
+                return datatypes_list[self._bit_length_index_map[bit_length]][0]
 
             # If the loop above was not able to resolve the datatype, issues an error
             message = (
@@ -1194,6 +1465,101 @@ class NumpyDataConverter:
             )
             console.error(message=message, error=TypeError)
 
+    def _convert_list_to_numpy(self, values: list[Any]) -> NDArray[Any] | None:
+        """Converts a list of validated Python values to a numpy array of the predetermined datatype using a single
+        vectorized cast.
+
+        Since the PythonDataConverter instance is configured to produce exactly one output type, all elements of the
+        input list share the same Python type. This allows resolving the output datatype once for the whole list and
+        converting all elements with a single array creation call, instead of converting each element separately
+        and then stacking the resultant numpy scalars.
+
+        Args:
+            values: The list of values validated by the PythonDataConverter instance.
+
+        Returns:
+            The converted numpy array or None, if any of the values cannot be represented using the target datatype.
+            In the latter case, the caller is expected to fall back to the element-wise conversion, which raises the
+            appropriate error for the offending value.
+        """
+        element_type = type(values[0])
+
+        # Since both the datatype and the number of elements are known in advance, all arrays are created using
+        # fromiter(), which allocates the output array once and does not need to infer the datatype from the values.
+        count = len(values)
+
+        # Boolean and None conversions do not depend on the output bit-width
+        if element_type is bool:
+            return np.fromiter(values, dtype=np.bool, count=count)
+        if element_type is NoneType:
+            return np.full(count, np.nan)
+
+        # Non-finite floating values (nan and +- inf) cannot be represented using any supported datatype and are
+        # handled by the element-wise conversion. They are detected upfront, as the min() and max() calls used to
+        # resolve the datatype skip nan values that are not the first element of the list.
+        source: NDArray[np.float64] | None = None
+        if element_type is float:
+            source = np.fromiter(values, dtype=np.float64, count=count)
+            if not np.isfinite(source).all():
+                return None
+
+        # Resolves the datatype that can represent all list values
+        datatype = self._resolve_list_datatype(values=values, element_type=element_type)
+        if datatype is None:
+            return None
+
+        if source is None:
+            return np.fromiter(values, dtype=datatype, count=count)
+
+        # For fixed bit-width floating outputs, also ensures that no non-zero values are rounded to zero during
+        # conversion, which is treated as an overflow by the element-wise conversion.
+        converted = source.astype(datatype)
+        underflow = self._output_bit_width != "auto" and np.any((converted == 0.0) & (source != 0.0))
+        return None if underflow else converted
+
+    def _resolve_list_datatype(self, values: list[Any], element_type: type) -> type | None:
+        """Resolves the smallest numpy datatype that can represent all values of the input list.
+
+        This is a service method used by the _convert_list_to_numpy() method to select the output datatype based on the
+        class configuration and the range of the list values.
+
+        Args:
+            values: The list of validated integer or floating values. All values have to be finite.
+            element_type: The Python type shared by all list values.
+
+        Returns:
+            The numpy datatype that can represent all list values or None, if the list values are not numeric or if no
+            supported datatype can represent all of them.
+        """
+        # Selects the datatypes to evaluate. For 'auto' bit-width, these are all supported datatypes ordered by their
+        # bit-width. Otherwise, this is the single datatype that matches the requested bit-width.
+        candidates: list[tuple[type, Any, Any]]
+        if element_type is int:
+            if self._output_bit_width == "auto":
+                candidates = self._signed_types if self._signed else self._unsigned_types
+            elif self._integer_datatype is not None:
+                candidates = [self._integer_datatype]
+            else:
+                return None
+        elif element_type is float:
+            if self._output_bit_width == "auto":
+                candidates = self._float_types
+            elif self._floating_datatype is not None:
+                candidates = [self._floating_datatype]
+            else:
+                return None
+        else:
+            return None
+
+        # Since the datatypes are ordered by their bit-width, the first datatype that can represent both the smallest
+        # and the largest value of the list can represent all list values.
+        minimum = min(values)
+        maximum = max(values)
+        for datatype, minimum_value, maximum_value in candidates:
+            if minimum_value <= minimum and maximum <= maximum_value:
+                return datatype
+        return None
+
     def convert_value_to_numpy(
         self,
         value: int | float | bool | None | str | list[Any] | tuple[Any],
@@ -1224,7 +1590,14 @@ class NumpyDataConverter:
         # Ensures that converted values are cast to lists to optimize the code structure below. Casts input values to
         # the pre-selected datatype that is used to 'funnel' different input values to the same numpy datatype.
         # Note, if the value cannot eb converted to the desired datatype, this will trigger a ValueError.
-        validated_list: list[Any] = ensure_list(self.python_converter.validate_value(value))
+        validated_list: list[Any] = _ensure_list(self.python_converter.validate_value(value))
+
+        # Whenever possible, converts iterable inputs using a single vectorized cast. If any of the values does not
+        # fit into the target datatype, falls back to the element-wise conversion below to raise the appropriate error.
+        if len(validated_list) > 1:
+            converted_array = self._convert_list_to_numpy(validated_list)
+            if converted_array is not None:
+                return converted_array
 
         # Generates the placeholder list which aggregates converted scalars
         scalar_list: list[Any] = []
@@ -1233,8 +1606,8 @@ class NumpyDataConverter:
         # numpy scalars that use the requested datatype and (for integers) signed / unsigned type.
         numpy_value: np.integer[Any] | np.unsignedinteger[Any] | np.bool | np.floating[Any] | float
         datatype: type
-        minimum_value: int | np.floating[Any]
-        maximum_value: int | np.floating[Any]
+        minimum_value: int | float
+        maximum_value: int | float
         for value in validated_list:
             # If the input is a boolean type, converts it to numpy boolean
             if isinstance(value, bool):
@@ -1253,21 +1626,13 @@ class NumpyDataConverter:
 
             # If the input is an integer, attempts to convert it to the requested integer datatype.
             elif isinstance(value, int) and not isinstance(self._output_bit_width, str):
-                # Depending on whether signed or unsigned integers are required, uses the predefined bit-width to
-                # index the callable numpy type from the appropriate list.
-                if self._signed:
-                    datatype = self._signed_types[self._integer_index_map[self._output_bit_width]][0]
-                    minimum_value = self._signed_types[self._integer_index_map[self._output_bit_width]][1]
-                    maximum_value = self._signed_types[self._integer_index_map[self._output_bit_width]][2]
-                else:
-                    datatype = self._unsigned_types[self._integer_index_map[self._output_bit_width]][0]
-                    minimum_value = self._unsigned_types[self._integer_index_map[self._output_bit_width]][1]
-                    maximum_value = self._unsigned_types[self._integer_index_map[self._output_bit_width]][2]
-
-                # Attempts to convert the value to the requested datatype
-                try:
-                    numpy_value = datatype(value)
-                except OverflowError:
+                # Retrieves the callable numpy type (and its limits) resolved for the requested bit-width and
+                # signed / unsigned type at initialization.
+                datatype, minimum_value, maximum_value = self._integer_datatype  # type: ignore
+
+                # Verifies that the value fits into the requested datatype before converting it. This is cheaper than
+                # relying on numpy to raise (and then handling) an OverflowError during conversion.
+                if not minimum_value <= value <= maximum_value:
                     message = (
                         f"Unable to convert the input integer value {value}, which is part of the collection "
                         f"{validated_list} to the requested type ({datatype.__name__}). The value does not fit into "
@@ -1275,13 +1640,14 @@ class NumpyDataConverter:
                         f"and {maximum_value}."
                     )
                     console.error(message=message, error=OverflowError)
+                numpy_value = datatype(value)
 
             # The only left 'case' here is that the input is a float. Attempts to convert it to the requested
             # numpy floating datatype.
             else:
                 # Since fewer bit-widths are supported for floats than for integers, catches cases where floats are
                 # attempted to be converted to unsupported bit-width range.
-                if self._output_bit_width not in self._floating_index_map.keys():
+                if self._floating_datatype is None:
                     message = (
                         f"Unable to convert the input floating value {value}, which is part of the collection "
                         f"{validated_list} to the requested bit-width ({self._output_bit_width}). Currently, "
@@ -1290,22 +1656,19 @@ class NumpyDataConverter:
                     console.error(message=message, error=ValueError)
 
                 # Resolves the fixed datatype to convert the value into
-                datatype = self._float_types[self._floating_index_map[self._output_bit_width]][0]  # type: ignore
-                minimum_value = self._float_types[self._floating_index_map[self._output_bit_width]][1]  # type: ignore
-                maximum_value = self._float_types[self._floating_index_map[self._output_bit_width]][2]  # type: ignore
+                datatype, minimum_value, maximum_value = self._floating_datatype  # type: ignore
 
-                # Attempts value conversion. Raises exceptions if the value cannot be converted
-                try:
-                    # noinspection PyUnboundLocalVariable
+                # Verifies that the value fits into the requested datatype before converting it. Besides being cheaper
+                # than handling conversion errors, this prevents numpy from issuing RuntimeWarnings for the values
+                # that overflow the datatype. Nan values do not pass this check either.
+                fits = minimum_value <= value <= maximum_value
+                if fits:
                     numpy_value = datatype(value)
-                    # This catches the numpy behavior for too large negative inputs. A negative float that has too many
-                    # trailing zeroes will be rounded to 0.0, which is considered not desirable. It is converted into an
-                    # OverflowError instead.
-                    if numpy_value == 0.0 and value != 0.0 or np.isinf(numpy_value) or np.isnan(numpy_value):
-                        raise OverflowError
-                # The method correctly triggers an overflow error when the value is too large. Combined with the
-                # 'manual' overflow triggered above, this covers both extremes.
-                except OverflowError:
+                    # This catches the numpy behavior for too small inputs. A non-zero float that has too many
+                    # trailing zeroes will be rounded to 0.0, which is considered not desirable. It is treated as an
+                    # overflow instead.
+                    fits = numpy_value != 0.0 or value == 0.0
+                if not fits:
                     message = (
                         f"Unable to convert the input floating value {value}, which is part of the collection "
                         f"{validated_list} to the requested type ({datatype.__name__}). The value does not fit into "
@@ -1361,24 +1724,34 @@ class NumpyDataConverter:
             # If the value is a one-dimensional numpy array, first converts it to a list using tolist() method
             output_list = value.tolist()
 
-            # Then, uses list comprehension to replace np.nan and np.inf with python None values
-            output_list = [None if value == np.nan or value == np.inf else value for value in output_list]
+            # Then, replaces non-finite values (nan and +- inf) with python None values. Only floating arrays can
+            # contain such values, and they are discovered using a single vectorized mask computation. Only the
+            # positions of non-finite values are visited when replacing them, so arrays of finite values are not
+            # iterated at all.
+            if value.dtype.kind in "fc":
+                for index in np.flatnonzero(~np.isfinite(value)).tolist():
+                    output_list[index] = None
 
             # Runs the filtered list through the Python Converter to bring it to the same output datatype or
-            # raise a ValueError if any of the elements are not convertible.
-            converted_value = self._python_converter.validate_value(output_list)
+            # raise a ValueError if any of the elements are not convertible. Since the elements of one-dimensional
+            # non-object arrays are always scalars, these lists are validated directly, skipping the sub-iterable
+            # check carried out by the validate_value() method.
+            if value.ndim == 1 and value.dtype.kind != "O":
+                converted_value = self._python_converter.validate_list(output_list)
+            else:
+                converted_value = self._python_converter.validate_value(output_list)
 
             # PythonDataConverter automatically pops one-element lists into scalars. Therefore, the returned value is
             # already using the most efficient type and can be returned to caller.
             return converted_value  # type: ignore
 
-        # If the input value is a numpy nan or inf, replaces it with Python None and runs it through the
-        # PythonDataConverter before returning it to caller.
-        elif np.isnan(value) or np.isinf(value):
-            return self._python_converter.validate_value(None)  # type: ignore
+        # Otherwise, if the input is a numpy scalar, pops it out as a Python scalar using the item() method. Python
+        # scalars, such as np.nan, are used as-is.
+        python_value = value.item() if isinstance(value, np.generic) else value
 
-        # Finally, if the input is a numpy scalar, pops it out as a numpy scalar using the item() method and runs it
-        # through the PythonDataConverter before returning it to caller.
-        else:
-            output = self._python_converter.validate_value(value.item())
-            return output  # type: ignore
+        # If the input value is a nan or inf, replaces it with Python None. Since the value is already a Python scalar,
+        # this is checked without dispatching to numpy ufuncs. Finally, runs the value through the PythonDataConverter
+        # before returning it to caller.
+        if type(python_value) is float and not isfinite(python_value):
+            python_value = None
+        return self._python_converter.validate_value(python_value)  # type: ignore
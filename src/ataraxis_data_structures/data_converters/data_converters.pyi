@@ -4,6 +4,36 @@ import numpy as np
 from _typeshed import Incomplete
 from numpy.typing import NDArray
 
+def _verify_boolean_arguments(class_name: str, arguments: dict[str, Any]) -> None:
+    """Verifies that all input class initialization arguments are booleans.
+
+    This is a service function used by all converter classes to verify their boolean initialization arguments. Since
+    bool cannot be subclassed, the function uses exact type checks, which are faster than isinstance() checks.
+
+    Args:
+        class_name: The name of the initialized class, used in the error message.
+        arguments: The dictionary that maps the names of the verified arguments to their values.
+
+    Raises:
+        TypeError: If any of the input arguments is not a boolean.
+    """
+
+_scalar_types: frozenset[type]
+
+def _ensure_list(value: Any) -> list[Any]:
+    """Ensures that the input value is returned as a list.
+
+    This is a thin wrapper over the ensure_list() function from the ataraxis-base-utilities library that resolves the
+    most common inputs processed by converter classes (lists, tuples and Python scalars) using exact type checks. All
+    other inputs, such as numpy arrays and scalars, are forwarded to the ensure_list() function.
+
+    Args:
+        value: The value to be converted into / preserved as a Python list.
+
+    Returns:
+        A Python list that contains the input value data.
+    """
+
 class NumericConverter:
     """A factory-like class for validating and converting numeric values based on a predefined configuration.
 
@@ -32,6 +62,10 @@ class NumericConverter:
         _upper_limit: Optional. An integer or float that specifies the upper limit for numeric value
             verification. Verified integers and floats that are larger than the limit number will be considered invalid.
             Set to None to disable upper-limit.
+        _lower_bound: The lower limit used during value validation. Unlike _lower_limit, this is set to negative
+            infinity if the lower limit is disabled, so that validation does not need to check whether the limit is set.
+        _upper_bound: Same as _lower_bound, but for the upper limit. Set to positive infinity if the upper limit is
+            disabled.
         _parse_strings: Determines whether to attempt validating strings as number types (with necessary conversions).
         _allow_int: Determines whether the class can validate and convert inputs into integer values.
         _allow_float: Determines whether the class can validate and convert inputs into float values.
@@ -42,11 +76,14 @@ class NumericConverter:
             not None. If both integer and float outputs are not allowed.
     """
 
+    _exact_float_limit: float
     _parse_strings: Incomplete
     _allow_int: Incomplete
     _allow_float: Incomplete
     _lower_limit: Incomplete
     _upper_limit: Incomplete
+    _lower_bound: int | float
+    _upper_bound: int | float
     def __init__(
         self,
         number_lower_limit: int | float | None = None,
@@ -98,6 +135,39 @@ class NumericConverter:
             conversion fails for any reason.
         """
 
+    def validate_array(self, values: list[Any] | tuple[Any, ...] | NDArray[Any]) -> NDArray[np.float64]:
+        """Validates all input values at the same time, marking the values that fail validation with NaN.
+
+        This method validates each value as if it was passed to the validate_value() method as a Python object, but
+        processes numeric numpy arrays (and collections of numbers) with vectorized numpy operations instead of
+        validating each value separately. This is considerably faster for large collections of numeric values.
+        Collections that contain non-numeric values, such as strings, are validated element-wise, using the
+        validate_value() method.
+
+        Notes:
+            Since the method uses NaN to mark invalid values, the output array always uses the float64 datatype, even
+            if the class is configured to only output integers. In that case, all valid values are integer-convertible
+            without data loss.
+
+            The results differ from calling validate_value() on each value in the following cases:
+            - The elements of numpy arrays are validated as their Python equivalents (as returned by the array tolist()
+              method). Therefore, the elements of numeric numpy integer arrays are valid, although the validate_value()
+              method rejects numpy integer scalars.
+            - Integers are returned as float64 values, so integers outside the ±2**53 range, where floats represent all
+              integers exactly, are rounded to the nearest representable float64 value.
+
+        Args:
+            values: The numpy array or the one-dimensional list or tuple of values to validate. Numpy arrays can have
+                any shape.
+
+        Returns:
+            The float64 numpy array with the same shape as the input array, which stores the validated values. The
+            values that failed validation are replaced with NaN.
+
+        Raises:
+            TypeError: If the input values are not stored in a numpy array, list or tuple.
+        """
+
 class BooleanConverter:
     """A factory-like class for validating and converting boolean values based on a predefined configuration.
 
@@ -115,13 +185,16 @@ class BooleanConverter:
             boolean-equivalent parsing is allowed, these values will be converted to and recognized as valid boolean
             True values.
         _false_equivalents: Same as true_equivalents, but for boolean False equivalents.
+        _bool_equivalents: Maps each true and false equivalent to the boolean value it represents. This allows
+            resolving boolean-equivalents with a single dictionary lookup.
 
     Raises:
         TypeError: If the input parse_boolean_equivalents argument is not a boolean.
     """
 
-    _true_equivalents: set[str | int | float]
-    _false_equivalents: set[str | int | float]
+    _true_equivalents: frozenset[str | int | float]
+    _false_equivalents: frozenset[str | int | float]
+    _bool_equivalents: dict[str | int | float, bool]
     _parse_bool_equivalents: Incomplete
     def __init__(self, *, parse_boolean_equivalents: bool = True) -> None: ...
     def __repr__(self) -> str:
@@ -129,6 +202,14 @@ class BooleanConverter:
     @property
     def parse_boolean_equivalents(self) -> bool:
         """Returns True if the class is configured to parse boolean equivalents as boolean values."""
+    @classmethod
+    def boolean_equivalents(cls) -> tuple[str | int | float, ...]:
+        """Returns the values recognized as boolean equivalents when the class is configured to parse boolean
+        equivalents.
+
+        The values are sorted by their type name and then by their string representation, so that the returned order
+        does not depend on the (randomized) iteration order of the equivalents sets.
+        """
     def validate_value(self, value: bool | str | int | float | None) -> bool | None:
         """Ensures that the input value is a valid boolean.
 
@@ -167,7 +248,7 @@ class NoneConverter:
         TypeError: If the input parse_none_equivalents argument is not a boolean.
     """
 
-    _none_equivalents: set[str]
+    _none_equivalents: frozenset[str]
     _parse_none_equivalents: Incomplete
     def __init__(self, *, parse_none_equivalents: bool = True) -> None: ...
     def __repr__(self) -> str:
@@ -175,6 +256,11 @@ class NoneConverter:
     @property
     def parse_none_equivalents(self) -> bool:
         """Returns True if the class is configured to parse None-equivalent inputs as None values."""
+    @classmethod
+    def none_equivalents(cls) -> tuple[str, ...]:
+        """Returns the strings recognized as None equivalents when the class is configured to parse None
+        equivalents.
+        """
     def validate_value(self, value: Any) -> None | str:
         """Ensures that the input value is a valid NoneType (None).
 
@@ -223,6 +309,11 @@ class StringConverter:
     Attributes:
         _string_options: Optional. A tuple or list of string-options. If provided, all validated strings will be
             checked against the input iterable and only considered valid if the string matches one of the options.
+        _string_option_set: Optional. Stores the lower-case string-options as a frozenset, which is used to check
+            validated strings against the options with a single hash lookup. Set to None if option-checking is disabled.
+        _lower_input: Determines whether validated strings have to be converted to lower-case, either to check them
+            against the string-options or to return them as lower-case strings. This is resolved once, at
+            initialization, to avoid re-evaluating the configuration for each validated value.
         _string_force_lower: Determines if validated string values have to be converted to lower-case.
         _allow_string_conversion: Determines whether to convert non-string inputs to strings. Setting this to true is
             fairly dangerous, as almost anything can be converted to a string.
@@ -236,6 +327,8 @@ class StringConverter:
     _allow_string_conversion: Incomplete
     _string_force_lower: Incomplete
     _string_options: Incomplete
+    _string_option_set: frozenset[str] | None
+    _lower_input: bool
     def __init__(
         self,
         string_options: list[str] | tuple[str] | None = None,
@@ -284,7 +377,7 @@ class PythonDataConverter:
     """After initial configuration, allows conditionally validating and / or converting input values to a specified
     pythonic output type.
 
-    Broadly, this class is designed to wrap one or more \'base\' converter classes (NumericConverter, BooleanConverter,
+    Broadly, this class is designed to wrap one or more 'base' converter classes (NumericConverter, BooleanConverter,
     StringConverter, NoneConverter) and extend their value validation methods to work for iterable inputs. Combining
     multiple converters allows the class to apply them hierarchically to process a broad range of input values
     (see the Notes section below for details). This design achieves maximum conversion / validation flexibility, making
@@ -293,7 +386,7 @@ class PythonDataConverter:
     Notes:
         When multiple converter options are used, the class always defers to the following hierarchy:
         float > integer > boolean > None > string. This hierarchy is chosen to (roughly) prioritize outputting
-        \'non-permissive\' types first. For example, an integer is always float-convertible, but not vice versa. Since
+        'non-permissive' types first. For example, an integer is always float-convertible, but not vice versa. Since
         almost every input is potentially convertible to a string, the strings are evaluated last.
 
         The primary application for this class is to help configuration classes (YamlConfig, for example), which store
@@ -338,6 +431,13 @@ class PythonDataConverter:
             an input fails validation.
         _allowed_outputs: A set that stores all output types that are supported by the current class configuration.
         _supported_iterables: A dictionary that maps supported output iterable keys to callable types.
+        _literal_results: Stores the validation results for the boolean and None equivalent literals ('True', 'null',
+            '1', etc.). These results are computed at initialization and are never evicted.
+        _string_results: Caches the validation results for all other string inputs. Configuration classes typically
+            validate the same strings many times, and strings are the most expensive inputs to validate, as each
+            converter has to parse them.
+        _string_cache_size: The maximum number of string validation results stored in the _string_results cache. When
+            the cache is full, the oldest cached result is evicted before caching the next result.
 
     Raises:
         TypeError: If any of the input arguments are not of the expected type.
@@ -345,6 +445,7 @@ class PythonDataConverter:
     """
 
     _supported_iterables: Incomplete
+    _string_cache_size: int
     _allowed_outputs: Incomplete
     _numeric_converter: Incomplete
     _none_converter: Incomplete
@@ -353,6 +454,8 @@ class PythonDataConverter:
     _iterable_output_type: Incomplete
     _filter_failed_elements: Incomplete
     _raise_errors: Incomplete
+    _string_results: dict[str, tuple[bool, int | float | str | bool | None]]
+    _literal_results: dict[str, tuple[bool, int | float | str | bool | None]]
     def __init__(
         self,
         numeric_converter: NumericConverter | None = None,
@@ -424,6 +527,20 @@ class PythonDataConverter:
             Follows the following conversion hierarchy if multiple converters are active:
             float > integer > boolean > None > string.
 
+        Args:
+            value: The value to be validated and / or converted.
+
+        Returns: A tuple that contains two values. The first is a boolean that indicates if the returned value passed
+            or failed validation. The second is either the validated / converted value or a None placeholder.
+        """
+    def _apply_converters_cached(self, value: Any) -> tuple[bool, int | float | str | bool | None]:
+        """Hierarchically applies each of the converters to the input scalar value, reusing the cached results for
+        previously validated strings.
+
+        Only the results for (exact) string inputs are cached. Since the converters cannot be reconfigured, the result
+        for the same string never changes. Other inputs are either cheap to validate or cannot be safely used as
+        cache keys (e.g.: 0.0 and -0.0 are equal, but may produce different outputs).
+
         Args:
             value: The value to be validated and / or converted.
 
@@ -458,6 +575,28 @@ class PythonDataConverter:
             ValueError: If the val;ue to validate is iterable with multiple dimensions. If the input scalar value or
                 any element of an iterable value cannot be validated, and the raise_errors attribute is set to True.
         """
+    def validate_list(
+        self, list_value: list[Any]
+    ) -> int | float | bool | None | str | list[int | float | bool | str | None] | tuple[int | float | str | None, ...]:
+        """Validates the elements of the input one-dimensional list and converts them to the preferred datatype.
+
+        This method contains the core iterable-processing logic of the validate_value() method. Unlike
+        validate_value(), it does not check the input list for sub-iterables and expects the caller to ensure that the
+        list is one-dimensional. Use it instead of validate_value() when processing inputs that are known to be
+        one-dimensional lists of scalars, such as the lists produced from one-dimensional numpy arrays, to skip the
+        sub-iterable check.
+
+        Args:
+            list_value: The one-dimensional list of values to be validated and converted.
+
+        Returns:
+            The validated and converted value(s), processed according to the class configuration. See the
+            validate_value() method for details.
+
+        Raises:
+            ValueError: If any element of the input list cannot be validated, and the raise_errors attribute is set to
+                True.
+        """
 
 class NumpyDataConverter:
     """After initial configuration, allows conditionally converting input python values to a specified numpy output
@@ -499,7 +638,13 @@ class NumpyDataConverter:
             the 'types' lists to retrieve the callable datatype. This is used to access the callable datatypes used for
             python to numpy conversion based on teh class configuration.
         _floating_index_map: Same as _integer_index_map, but for floating point numpy datatypes.
+        _bit_length_index_map: Maps the number of bits required to represent an integer value to the index of the
+            integer datatype with the minimum bit-width that can represent the value.
         _supported_output_bit_widths: Stores supported output_bit_width argument values as a set.
+        _integer_datatype: The integer numpy datatype (and its limits) used for fixed bit-width conversions. Resolved
+            at initialization based on the output bit-width and the signed / unsigned type. None for 'auto' bit-width.
+        _floating_datatype: Same as _integer_datatype, but for floating point numpy datatypes. Also None if the
+            requested bit-width is not supported by floating point datatypes.
 
     Raises:
         TypeError: If any class arguments are not of the expected types.
@@ -510,13 +655,16 @@ class NumpyDataConverter:
 
     _signed_types: list[tuple[type, int, int]]
     _unsigned_types: list[tuple[type, int, int]]
-    _float_types: list[tuple[type, np.floating[Any], np.floating[Any]]]
+    _float_types: list[tuple[type, float, float]]
     _integer_index_map: dict[int, int]
     _floating_index_map: dict[int, int]
+    _bit_length_index_map: tuple[int, ...]
     _supported_output_bit_widths: set[int | str]
     _signed: Incomplete
     _python_converter: Incomplete
     _output_bit_width: Incomplete
+    _integer_datatype: tuple[type, int, int] | None
+    _floating_datatype: tuple[type, float, float] | None
     def __init__(
         self, python_converter: PythonDataConverter, output_bit_width: int | str = "auto", signed: bool = True
     ) -> None: ...
@@ -559,6 +707,37 @@ class NumpyDataConverter:
             OverflowError: If the value is too large to be represented by the supported integer or floating numpy
                 datatype bit-widths.
         """
+    def _convert_list_to_numpy(self, values: list[Any]) -> NDArray[Any] | None:
+        """Converts a list of validated Python values to a numpy array of the predetermined datatype using a single
+        vectorized cast.
+
+        Since the PythonDataConverter instance is configured to produce exactly one output type, all elements of the
+        input list share the same Python type. This allows resolving the output datatype once for the whole list and
+        converting all elements with a single array creation call, instead of converting each element separately
+        and then stacking the resultant numpy scalars.
+
+        Args:
+            values: The list of values validated by the PythonDataConverter instance.
+
+        Returns:
+            The converted numpy array or None, if any of the values cannot be represented using the target datatype.
+            In the latter case, the caller is expected to fall back to the element-wise conversion, which raises the
+            appropriate error for the offending value.
+        """
+    def _resolve_list_datatype(self, values: list[Any], element_type: type) -> type | None:
+        """Resolves the smallest numpy datatype that can represent all values of the input list.
+
+        This is a service method used by the _convert_list_to_numpy() method to select the output datatype based on the
+        class configuration and the range of the list values.
+
+        Args:
+            values: The list of validated integer or floating values. All values have to be finite.
+            element_type: The Python type shared by all list values.
+
+        Returns:
+            The numpy datatype that can represent all list values or None, if the list values are not numeric or if no
+            supported datatype can represent all of them.
+        """
     def convert_value_to_numpy(
         self, value: int | float | bool | None | str | list[Any] | tuple[Any]
     ) -> np.integer[Any] | np.unsignedinteger[Any] | np.floating[Any] | np.bool | NDArray[Any]:
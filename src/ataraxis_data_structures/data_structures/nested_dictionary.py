@@ -13,7 +13,34 @@ from typing import Any, Type, Literal, Optional
 
 import numpy as np
 from numpy.typing import NDArray
-from ataraxis_base_utilities import console, ensure_list
+from ataraxis_base_utilities import console
+
+# Stores the datatypes that are known to be immutable. Values of these types can be safely shared between the original
+# and the copied dictionary, which allows skipping the (comparatively slow) deepcopy() call for most terminal values.
+_immutable_types: frozenset[type] = frozenset({int, float, complex, str, bytes, bool, NoneType})
+
+
+def _clone_nested_dictionary(value: Any) -> Any:
+    """Recursively copies the input nested dictionary (or any of its values).
+
+    This is a faster alternative to copy.deepcopy() specialized for nested dictionaries. Dictionaries and lists are
+    rebuilt recursively, immutable scalars are shared between the original and the copy, and any other value is
+    copied via copy.deepcopy() to preserve the original deep-copy semantics.
+
+    Args:
+        value: The dictionary (or dictionary value) to copy.
+
+    Returns:
+        The independent copy of the input value.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _clone_nested_dictionary(item) for key, item in value.items()}
+    if value_type is list:
+        return [_clone_nested_dictionary(item) for item in value]
+    if value_type in _immutable_types:
+        return value
+    return copy.deepcopy(value)
 
 
 class NestedDictionary:
@@ -239,6 +266,12 @@ class NestedDictionary:
                 key_datatypes property (most often an empty set), likely due to the class wrapping an empty dictionary.
         """
 
+        # Tuples are the native path format used by all class methods, so they are returned without any processing.
+        # This is the most common input format for internal method calls, which pass raw paths extracted from the
+        # dictionary.
+        if type(variable_path) is tuple:
+            return variable_path
+
         # For string variable paths, converts the input path keys (formatted as string) into the datatype used by
         # the dictionary keys.
         if isinstance(variable_path, str):
@@ -266,9 +299,8 @@ class NestedDictionary:
             # Splits the string path into keys using clas delimiter
             string_keys: list[str] = variable_path.split(self._path_delimiter)
 
-            # Pops the only supported key datatype name out of the storage set to be used below.
-            # Deepcopy is used to protect the _key_datatypes attribute from being modified.
-            target_dtype = copy.deepcopy(self._key_datatypes).pop()
+            # Retrieves the only supported key datatype name from the storage set without modifying the set.
+            target_dtype = next(iter(self._key_datatypes))
 
             # This will raise a ValueError if the conversion fails
             # noinspection PyTypeChecker, LongLine
@@ -350,10 +382,8 @@ class NestedDictionary:
 
         def _inner_extract(
             input_dict: dict[Any, Any],
-            current_path: Optional[list[Any]] = None,
-            *,
-            make_raw: bool = False,
-        ) -> list[tuple[Any, ...]] | list[str]:
+            current_path: tuple[Any, ...] = (),
+        ) -> list[tuple[Any, ...]]:
             """Performs the recursive path extraction procedure.
 
             This sub-method is used to hide recursion variables from end-users, so that they cannot accidentally set
@@ -365,27 +395,22 @@ class NestedDictionary:
                 input_dict: The dictionary to crawl through. During recursive calls, this variable is used to evaluate
                     sub-dictionaries discovered when crawling the original input dictionary, until the method reaches
                     a non-dictionary value.
-                current_path: The ordered list of keys, relative to the top level of the evaluated dictionary. This is
+                current_path: The ordered tuple of keys, relative to the top level of the evaluated dictionary. This is
                     used to iteratively construct the sequential key path to each non-dictionary variable. Specifically,
                     recursive method calls add newly discovered keys to the end of the already constructed path key
-                    list, preserving the nested hierarchy. This variable is reserved for recursive use, do not change
+                    tuple, preserving the nested hierarchy. This variable is reserved for recursive use, do not change
                     its value!
-                make_raw: An alias for the parent method return_raw parameter. This is automatically set to match the
-                    parent method return_raw parameter.
 
             Returns:
-                A list of key tuples if return_raw (make_raw) is True and a list of strings otherwise.
+                A list of key tuples, where each tuple stores the path to a terminal value or empty sub-dictionary.
             """
 
-            # If current_path is None, creates a new list object to hold the keys. Note, this cannot be a set, as keys
-            # at different dictionary levels do not have to be unique, relative to each-other. Therefore, a set may
-            # encounter and remove one of the valid duplicated keys along the path. This list is used during recursive
-            # calls to keep track of paths being built
-            if current_path is None:
-                current_path = []
+            # Note, paths are tracked as tuples rather than sets, as keys at different dictionary levels do not have to
+            # be unique, relative to each-other. Tuples are also the raw path format, so the paths built during
+            # recursion can be returned without any additional conversion.
 
             # This is the overall returned list that keeps track of ALL discovered paths
-            paths: list[Any] = []
+            paths: list[tuple[Any, ...]] = []
 
             # Extracts all items from the current dictionary view
             items = input_dict.items()
@@ -394,12 +419,12 @@ class NestedDictionary:
             # dictionaries with empty sub-dictionaries as valid terminal paths. Note, this is only used for
             # sub-dictionaries. If the main dictionary is empty, it will be handled as 'no datatypes' case.
             if len(items) == 0 and len(current_path) != 0:
-                paths.append(tuple(current_path) if make_raw else self._path_delimiter.join(map(str, current_path)))
+                paths.append(current_path)
             else:
                 # Loops over each key and value extracted from the current view (level) of the nested dictionary
                 for key, value in items:
-                    # Appends the local level key to the path tracker list
-                    new_path = current_path + [key]
+                    # Appends the local level key to the path tracker tuple
+                    new_path = current_path + (key,)
 
                     # If the key points to a dictionary, recursively calls the extract method. Passes the current
                     # path tracker and the dictionary view returned by the evaluated key, to the new method call.
@@ -411,19 +436,24 @@ class NestedDictionary:
                         # Note, the 'extend' has to be used here over 'append' to iteratively 'stack' node keys as the
                         # method searches for the terminal variable.
                         # noinspection PyUnboundLocalVariable
-                        paths.extend(_inner_extract(input_dict=value, make_raw=make_raw, current_path=new_path))
+                        paths.extend(_inner_extract(input_dict=value, current_path=new_path))
                     else:
-                        # If the key references a non-dictionary variable, formats the constructed key sequence as a
-                        # tuple or as a delimited string and appends it to the path list, prior to returning it to
-                        # caller. The append operation ensures the path is kept as a separate list object within the
-                        # final output list.
-                        paths.append(tuple(new_path) if make_raw else self._path_delimiter.join(map(str, new_path)))
+                        # If the key references a non-dictionary variable, appends the constructed key tuple to the
+                        # path list, prior to returning it to caller.
+                        paths.append(new_path)
 
             return paths
 
-        # Generates a list of variable paths and converts it to tuple before returning it to the caller. Each path is
-        # formatted according to the requested output type by the inner method.
-        return tuple(_inner_extract(input_dict=self._nested_dictionary, make_raw=return_raw))  # type: ignore
+        # Crawls the dictionary to extract the raw paths. Note, the paths are re-extracted on every call, as the
+        # managed dictionary (and any sub-dictionary returned by read_nested_value()) can be modified directly by the
+        # caller, without the class being aware of the change.
+        raw_paths = tuple(_inner_extract(input_dict=self._nested_dictionary))
+
+        # Returns raw paths as-is. Otherwise, converts each path to a delimited string.
+        if return_raw:
+            return raw_paths
+        delimiter = self._path_delimiter
+        return tuple(delimiter.join(map(str, path)) for path in raw_paths)  # type: ignore
 
     def read_nested_value(self, variable_path: str | tuple[Any, ...] | list[Any] | NDArray[Any]) -> Any:
         """Reads the requested value from the nested dictionary using the provided variable_path.
@@ -547,7 +577,7 @@ class NestedDictionary:
         # original dictionary is protected from modification while this method runs. Depending on the input
         # arguments, the original dictionary may still be overwritten with the modified dictionary at the end of the
         # method runtime.
-        altered_dict: dict[Any, Any] = copy.deepcopy(self._nested_dictionary)
+        altered_dict: dict[Any, Any] = _clone_nested_dictionary(self._nested_dictionary)
         current_dict_view: dict[Any, Any] = altered_dict
 
         # Iterates through keys, navigating the dictionary or creating new nodes as needed.
@@ -781,7 +811,7 @@ class NestedDictionary:
         )
 
         # Generates a local copy of the dictionary to prevent unwanted modification of the wrapped dictionary.
-        processed_dict: dict[Any, Any] = copy.deepcopy(self._nested_dictionary)
+        processed_dict: dict[Any, Any] = _clone_nested_dictionary(self._nested_dictionary)
 
         # Initiates recursive processing by calling the first instance of the _inner_delete method. Note, the method
         # modifies the dictionary by reference and has no explicit return statement.
@@ -883,41 +913,33 @@ class NestedDictionary:
         # preserve the order of discovered keys relative to the order of the class dictionary. This method is
         # chosen for efficiency.
         passed_paths: set[tuple[Any, ...]] = set()
-        storage_list: list[tuple[Any, ...]] = []
-
-        # Loops over all discovered variable paths
-        for path in var_paths:
-            # Adjusts the search procedure based on the requested mode. This conditional assumes that the search_mode
-            # validity is verified before this conditional is entered.
-            if search_mode == "terminal_only":
-                # For terminal_only mode, limits search to the last key of each path.
-                keys = path[-1]
-                # Since 'terminal_only' mode relies on skipping all keys other than the terminal key, generates a
-                # modifier to make the general search procedure below correctly return the whole path despite only
-                # evaluating the last key.
-                modifier = len(path) - 1
-            elif search_mode == "intermediate_only":
-                # For 'intermediate_only' mode, removes the terminal keys from the search space.
-                keys = path[:-1]
-                # Due to how sub-path evaluation is handled, no modifier is needed in this case.
-                modifier = 0
-            else:
-                # For 'all' mode, keeps all keys and also does not use a modifier.
-                keys = path
-                modifier = 0
+        storage_list: list[tuple[Any, ...]]
+
+        # Adjusts the search procedure based on the requested mode. The mode is resolved once, before looping over
+        # paths, so that each mode uses a dedicated loop that only evaluates the keys relevant for that mode. This
+        # conditional assumes that the search_mode validity is verified before this conditional is entered.
+        if search_mode == "terminal_only":
+            # For terminal_only mode, limits search to the last key of each path. Since each extracted path is unique,
+            # the matching paths do not need to be checked for uniqueness.
+            storage_list = [path for path in var_paths if path[-1] == target_key]
+            passed_paths.update(storage_list)
+        else:
+            # For 'intermediate_only' mode, removes the terminal keys from the search space. For 'all' mode, keeps
+            # all keys.
+            terminal_offset = 1 if search_mode == "intermediate_only" else 0
+            storage_list = []
 
             # Carries out the search. This procedure goes through all keys remaining after adjusting the search space
-            # and compares each key to the target key. When multiple keys from each path can be evaluated, the procedure
-            # works from the highest level to the lowest level of each path. If any key in the sequence matches the
-            # target key, the path up to and including the key is saved to the return list.
-            for num, key in enumerate(ensure_list(keys), start=1):
-                # Note on 'ensure_list' above. For terminal keys, Python automatically optimizes one-element tuples to
-                # variables. This breaks the search mechanism here. To address the issue, keys are always cast to list
-                # before this loop is executed.
-                scanned_path = path[: num + modifier]
-                if key == target_key and scanned_path not in passed_paths:
-                    passed_paths.add(scanned_path)
-                    storage_list.append(scanned_path)  # Preserves order of key discovery
+            # and compares each key to the target key. The procedure works from the highest level to the lowest level
+            # of each path. If any key in the sequence matches the target key, the path up to and including the key is
+            # saved to the return list.
+            for path in var_paths:
+                for num in range(len(path) - terminal_offset):
+                    if path[num] == target_key:
+                        scanned_path = path[: num + 1]
+                        if scanned_path not in passed_paths:
+                            passed_paths.add(scanned_path)
+                            storage_list.append(scanned_path)  # Preserves order of key discovery
 
         # If at least one path was discovered, returns a correctly formatted output
         if len(passed_paths) > 0:
@@ -1000,29 +1022,73 @@ class NestedDictionary:
             )
             console.error(message=message, error=RuntimeError)
 
-        # Initializes a new nested dictionary class instance using parent class delimiter and an empty seed dictionary.
-        converted_dict: NestedDictionary = NestedDictionary(seed_dictionary={}, path_delimiter=self._path_delimiter)
+        # Initializes the dictionary that will store the converted data.
+        converted_dict: dict[Any, Any] = {}
 
         # Loops over each converted path, retrieves the value associated with the original (pre-conversion) path and
-        # writes it to the newly created dictionary using the converted path.
+        # writes it to the newly created dictionary using the converted path. Since this loop runs once for each
+        # dictionary variable, it crawls both dictionaries directly instead of calling read_nested_value() and
+        # write_nested_value() methods. This avoids copying the whole converted dictionary and re-extracting its key
+        # datatypes after each write.
+        # Since the paths are extracted by crawling the dictionary depth-first, consecutive paths usually share most of
+        # their intermediate keys. To take advantage of this, the loop keeps the stacks of the source and converted
+        # sections visited by the previous path and only navigates the part of each path that differs from the
+        # previous path.
+        source_sections: list[dict[Any, Any]] = [self._nested_dictionary]
+        converted_sections: list[dict[Any, Any]] = [converted_dict]
+        previous_path: tuple[Any, ...] = ()
         try:
             # noinspection PyUnboundLocalVariable
-            for num, path in enumerate(converted_paths):
-                # Retrieves the value using the unconverted path.
-                value: Any = self.read_nested_value(
-                    variable_path=all_paths[num],
-                )
+            for source_path, path in zip(all_paths, converted_paths, strict=True):
+                # Finds the number of leading intermediate keys shared with the previous path and discards the sections
+                # that are not shared.
+                depth = 0
+                shared_depth = min(len(previous_path), len(source_path)) - 1
+                while depth < shared_depth and previous_path[depth] == source_path[depth]:
+                    depth += 1
+                del source_sections[depth + 1 :]
+                del converted_sections[depth + 1 :]
+                previous_path = source_path
+
+                # Navigates the remaining intermediate keys of both dictionaries. For the converted dictionary,
+                # generates any missing sections along the way.
+                current_dict_view: dict[Any, Any] = converted_sections[-1]
+                for source_key, key in zip(source_path[depth:-1], path[depth:-1], strict=True):
+                    source_sections.append(source_sections[-1][source_key])
+
+                    if key not in current_dict_view:
+                        current_dict_view[key] = {}
+
+                    # If the intermediate key points to an existing non-dictionary value, this indicates that the
+                    # conversion resulted in a path collision.
+                    elif not isinstance(current_dict_view[key], dict):
+                        message = (
+                            f"Unable to traverse the intermediate key '{key}' when writing nested value to dictionary "
+                            f"using variable path '{path}', as it points to a non-dictionary value "
+                            f"'{current_dict_view[key]}' and overwriting is not allowed."
+                        )
+                        console.error(message=message, error=KeyError)
+
+                    current_dict_view = current_dict_view[key]
+                    converted_sections.append(current_dict_view)
+
+                # Retrieves the value using the unconverted terminal key. Since the path was extracted from the
+                # dictionary, it is guaranteed to be valid.
+                value: Any = source_sections[-1][source_path[-1]]
+
+                # Writes the value to the new dictionary using the converted terminal key. Overwriting is not allowed,
+                # so if the conversion resulted in any path duplication, raises an exception. The value is copied to
+                # prevent the converted dictionary from sharing mutable values with the original dictionary.
+                if path[-1] in current_dict_view:
+                    message = (
+                        f"Unable to write the value associated with terminal key '{path[-1]}', when writing nested "
+                        f"value to dictionary, using path '{path}'. The key already exists at this dictionary level "
+                        f"and writing using the key will overwrite the current value of the variable, which is not "
+                        f"allowed."
+                    )
+                    console.error(message=message, error=KeyError)
+                current_dict_view[path[-1]] = _clone_nested_dictionary(value)
 
-                # Writes the value to the new dictionary using the converted path. Since all overwriting options are
-                # disabled, if the conversion resulted in any path duplication or collision, the method will raise an
-                # exception
-                converted_dict.write_nested_value(
-                    variable_path=path,
-                    value=value,
-                    modify_class_dictionary=True,
-                    allow_terminal_overwrite=False,
-                    allow_intermediate_overwrite=False,
-                )
         except Exception as e:
             message = (
                 f"Unable to recreate the dictionary using converted paths when converting the nested dictionary "
@@ -1034,12 +1100,12 @@ class NestedDictionary:
         # If class dictionary modification is preferred, replaces the wrapped class dictionary with the modified
         # dictionary
         if modify_class_dictionary:
-            self._nested_dictionary = copy.deepcopy(converted_dict._nested_dictionary)
+            self._nested_dictionary = converted_dict
             # Updates dictionary key datatype tracker in case altered dictionary changed the number of unique
             # datatypes
             self._key_datatypes = self._extract_key_datatypes()
 
             return None
-        # Otherwise, returns the newly constructed NestedDictionary instance
+        # Otherwise, constructs and returns a new NestedDictionary instance around the converted dictionary
         else:
-            return converted_dict
+            return NestedDictionary(seed_dictionary=converted_dict, path_delimiter=self._path_delimiter)
@@ -3,6 +3,22 @@ from typing import Any, Literal
 from _typeshed import Incomplete
 from numpy.typing import NDArray
 
+_immutable_types: frozenset[type]
+
+def _clone_nested_dictionary(value: Any) -> Any:
+    """Recursively copies the input nested dictionary (or any of its values).
+
+    This is a faster alternative to copy.deepcopy() specialized for nested dictionaries. Dictionaries and lists are
+    rebuilt recursively, immutable scalars are shared between the original and the copy, and any other value is
+    copied via copy.deepcopy() to preserve the original deep-copy semantics.
+
+    Args:
+        value: The dictionary (or dictionary value) to copy.
+
+    Returns:
+        The independent copy of the input value.
+    """
+
 class NestedDictionary:
     """Wraps a nested (hierarchical) python dictionary and provides methods for manipulating its values.
 
@@ -5,14 +5,106 @@ Primarily, this class is designed to be used for storing configuration data used
 memory in a human-readable format. However, it can also be adapted for intermediate-term data storage, if needed.
 """
 
+import copy
 from typing import Any
 from pathlib import Path
-from dataclasses import asdict, dataclass
+from weakref import WeakKeyDictionary
+from dataclasses import fields, dataclass, is_dataclass
 
 import yaml
 from dacite import Config, from_dict
 from ataraxis_base_utilities import console
 
+# Uses the libyaml-backed C loader and dumper, if PyYAML was built with libyaml support. The C implementations are
+# considerably faster than the pure-Python ones and produce the same results. Note, the dumper is the (non-safe)
+# counterpart of the default yaml.dump() dumper, so that the set of Python types that can be saved is not reduced.
+try:
+    from yaml import (
+        CDumper as _Dumper,
+        CSafeLoader as _SafeLoader,
+    )
+except ImportError:  # pragma: no cover
+    from yaml import (  # type: ignore[assignment]
+        Dumper as _Dumper,
+        SafeLoader as _SafeLoader,
+    )
+
+# Stores the file extensions that can be used by the .yaml files read and written by YamlConfig instances.
+_yaml_suffixes: frozenset[str] = frozenset({".yaml", ".yml"})
+
+# Caches the names of the fields for each serialized dataclass type. Dataclass fields are fixed at class creation, so
+# resolving them once per class allows skipping the fields() introspection for every subsequent serialization. The
+# classes are referenced weakly, so that caching does not prevent (locally defined) dataclasses from being
+# garbage-collected.
+_field_names: WeakKeyDictionary[type, tuple[str, ...]] = WeakKeyDictionary()
+
+# Stores the immutable built-in types that do not need to be copied when the dataclasses are serialized.
+_immutable_types: frozenset[type] = frozenset({str, int, float, bool, complex, bytes, type(None)})
+
+
+def _serialize_value(value: Any) -> Any:
+    """Recursively converts the input dataclass (or any of its field values) to the built-in Python types.
+
+    This is a faster alternative to dataclasses.asdict() used when dumping YamlConfig instances to .yaml files. Unlike
+    asdict(), it resolves the field names of each dataclass type only once and does not copy immutable built-in
+    values (strings, numbers, etc.). All other terminal values are deep-copied, matching the asdict() behavior.
+
+    Args:
+        value: The dataclass instance or the field value to convert.
+
+    Returns:
+        The dictionary that stores the dataclass data, if the input is a dataclass instance. Otherwise, the input value
+        with all nested dataclasses converted to dictionaries.
+    """
+    value_type = type(value)
+
+    # Immutable built-in values are the most common field values and are returned unchanged
+    if value_type in _immutable_types:
+        return value
+
+    # Resolves the field names of the dataclass from the cache or, if this is the first time the class is serialized,
+    # from the dataclass metadata.
+    names = _field_names.get(value_type)
+    if names is None and is_dataclass(value) and not isinstance(value, type):
+        names = _field_names[value_type] = tuple(field.name for field in fields(value))
+    if names is not None:
+        return {name: _serialize_value(getattr(value, name)) for name in names}
+
+    # Recursively processes built-in containers to discover nested dataclasses. Named tuples are reconstructed from
+    # positional arguments, matching the asdict() behavior.
+    if isinstance(value, dict):
+        return value_type((_serialize_value(key), _serialize_value(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return value_type(_serialize_value(item) for item in value)
+    if isinstance(value, tuple):
+        items = [_serialize_value(item) for item in value]
+        return value_type(*items) if hasattr(value, "_fields") else value_type(items)
+
+    # All other values (sets, custom objects, etc.) are deep-copied. Otherwise, the same object referenced by multiple
+    # fields would be dumped as a YAML anchor and a set of aliases, instead of being written out for each field.
+    return copy.deepcopy(value)
+
+
+def _raise_path_error(config_path: Path, action: str) -> None:
+    """Raises the error that communicates that the input path does not point to a .yaml or .yml file.
+
+    This function is only called when the path verification fails, which keeps the error message construction out of
+    the YamlConfig methods that work with .yaml files.
+
+    Args:
+        config_path: The invalid path provided to the YamlConfig method.
+        action: The description of the action that failed due to the invalid path. This is used to customize the
+            error message for each method.
+
+    Raises:
+        ValueError: Always.
+    """
+    message: str = (
+        f"Invalid file path provided when attempting to {action}. Expected a path ending in the '.yaml' or '.yml' "
+        f"extension, but encountered {config_path}. Provide a path that uses the correct extension."
+    )
+    console.error(message=message, error=ValueError)
+
 
 @dataclass
 class YamlConfig:
@@ -57,13 +149,8 @@ class YamlConfig:
         }
 
         # Ensures that the output file path points to a .yaml (or .yml) file
-        if not config_path.suffix == ".yaml" and not config_path.suffix == ".yml":
-            message: str = (
-                f"Invalid file path provided when attempting to write the YamlConfig class instance to a yaml file. "
-                f"Expected a path ending in the '.yaml' or '.yml' extension, but encountered {config_path}. Provide a "
-                f"path that uses the correct extension."
-            )
-            console.error(message=message, error=ValueError)
+        if config_path.suffix not in _yaml_suffixes:
+            _raise_path_error(config_path=config_path, action="write the YamlConfig class instance to a yaml file")
 
         # Ensures that the output directory exists. Co-opts a method used by Console class to ensure log file directory
         # exists.
@@ -72,7 +159,7 @@ class YamlConfig:
 
         # Writes the data to a .yaml file using custom formatting defined at the top of this method.
         with open(config_path, "w") as yaml_file:
-            yaml.dump(data=asdict(self), stream=yaml_file, **yaml_formatting)  # type: ignore
+            yaml.dump(data=_serialize_value(self), stream=yaml_file, Dumper=_Dumper, **yaml_formatting)  # type: ignore
 
     @classmethod
     def from_yaml(cls, config_path: Path) -> "YamlConfig":
@@ -97,21 +184,16 @@ class YamlConfig:
         """
 
         # Ensures that config_path points to a .yaml / .yml file.
-        if not config_path.suffix == ".yaml" and not config_path.suffix == ".yml":
-            message: str = (
-                f"Invalid file path provided when attempting to create the YamlConfig class instance from a yaml file. "
-                f"Expected a path ending in the '.yaml' or '.yml' extension, but encountered {config_path}. Provide a "
-                f"path that uses the correct extension."
-            )
-            console.error(message=message, error=ValueError)
+        if config_path.suffix not in _yaml_suffixes:
+            _raise_path_error(config_path=config_path, action="create the YamlConfig class instance from a yaml file")
 
         # Disables built-in dacite type-checking
         class_config = Config(check_types=False)
 
-        # Opens and reads the .yaml file. Note, safe_load may not work for reading python tuples, so it is advised
-        # to avoid using tuple in configuration files.
+        # Opens and reads the .yaml file. Note, the safe loader may not work for reading python tuples, so it is
+        # advised to avoid using tuple in configuration files.
         with open(config_path, "r") as yml_file:
-            data = yaml.safe_load(yml_file)
+            data = yaml.load(yml_file, Loader=_SafeLoader)
 
         # Converts the imported data to a python dictionary.
         config_dict: dict[Any, Any] = dict(data)
@@ -1,6 +1,42 @@
+from typing import Any
 from pathlib import Path
+from weakref import WeakKeyDictionary
 from dataclasses import dataclass
 
+_yaml_suffixes: frozenset[str]
+_field_names: WeakKeyDictionary[type, tuple[str, ...]]
+_immutable_types: frozenset[type]
+
+def _serialize_value(value: Any) -> Any:
+    """Recursively converts the input dataclass (or any of its field values) to the built-in Python types.
+
+    This is a faster alternative to dataclasses.asdict() used when dumping YamlConfig instances to .yaml files. Unlike
+    asdict(), it resolves the field names of each dataclass type only once and does not copy immutable built-in
+    values (strings, numbers, etc.). All other terminal values are deep-copied, matching the asdict() behavior.
+
+    Args:
+        value: The dataclass instance or the field value to convert.
+
+    Returns:
+        The dictionary that stores the dataclass data, if the input is a dataclass instance. Otherwise, the input value
+        with all nested dataclasses converted to dictionaries.
+    """
+
+def _raise_path_error(config_path: Path, action: str) -> None:
+    """Raises the error that communicates that the input path does not point to a .yaml or .yml file.
+
+    This function is only called when the path verification fails, which keeps the error message construction out of
+    the YamlConfig methods that work with .yaml files.
+
+    Args:
+        config_path: The invalid path provided to the YamlConfig method.
+        action: The description of the action that failed due to the invalid path. This is used to customize the
+            error message for each method.
+
+    Raises:
+        ValueError: Always.
+    """
+
 @dataclass
 class YamlConfig:
     """A Python dataclass bundled with methods to save and load itself from a .yml (YAML) file.
@@ -8,6 +8,7 @@ as an alternative to Queue objects.
 
 from copy import copy
 from typing import Any, Union, Iterable, Optional, Generator
+import platform
 from contextlib import contextmanager
 from multiprocessing import Lock
 from multiprocessing.shared_memory import SharedMemory
@@ -30,13 +31,36 @@ class SharedMemoryArray:
 
     This class should only be instantiated inside the main process via its create_array() method. Do not attempt to
     instantiate the class manually. All child processes working with this class should use the connect() method to
-    connect to the shared array wrapped by the class before calling any other method.
+    connect to the shared array wrapped by the class before calling any other method. The instance has to be passed to
+    the child processes (for example, as an argument of the Process), as this is how all processes receive the same
+    multiprocessing Lock.
 
     Notes:
         Shared memory objects are garbage-collected differently depending on the host OS. On Windows, garbage collection
         is handed off to the OS and cannot be enforced manually. On Unix (OSx and Linux), the buffer can be
         garbage-collected via appropriate commands.
 
+        Locked access to the array uses a sequence lock (seqlock). The first bytes of the shared buffer store a version
+        counter, which writers make odd before modifying the array and even after they are done. Writers serialize
+        each other with the multiprocessing Lock, but readers never acquire it. Instead, readers copy the data and
+        retry the copy if the version changed (or was odd) while the data was being copied. This allows any number of
+        processes to read the array concurrently without contending for the Lock. If the data keeps changing for too
+        many consecutive attempts, the reader falls back to acquiring the Lock, which guarantees that readers do not
+        spin indefinitely under heavy write load.
+
+        The seqlock relies on the processor preserving the order of memory loads and stores, which is only guaranteed
+        by strongly-ordered (x86 and x86-64) processors. Python does not expose memory fences, so on weakly-ordered
+        processors (for example, ARM64, including Apple Silicon Macs) a reader could observe the unchanged version
+        counter while accepting partially written data. On these platforms, locked reads always acquire the Lock, which
+        acts as a full memory barrier, and concurrent reads block each other.
+
+        Reads that use with_lock=False skip the seqlock (and the Lock) entirely. This is an explicit opt-in for
+        latency-critical polling of single elements, such as boolean flags or counters. The array data is aligned to
+        its element size in the shared buffer, so on most platforms such elements are loaded by a single machine
+        instruction. However, neither Python nor numpy guarantee this, so unlocked reads may observe torn values and
+        should only be used when this is acceptable. Writes that use with_lock=True always acquire the Lock, as they
+        also have to advance the version counter shared by all writers.
+
     Args:
         name: The descriptive name to use for the shared memory array. The OS uses names to identify shared
             memory objects and have to be unique.
@@ -50,12 +74,32 @@ class SharedMemoryArray:
         _shape: Stores the shape of the numpy array used to represent the buffered data.
         _datatype: Stores the datatype of the numpy array used to represent the buffered data.
         _buffer: The Shared Memory buffer object used to store the shared array data.
-        _lock: A Lock object used to prevent multiple processes from working with the shared array data at the same
-            time.
-        _array: Stores the connected shared numpy array.
-        _is_connected: Tracks whether the shared memory array wrapped by this class has been connected to.
+        _lock: A Lock object used to prevent multiple processes from writing to the shared array at the same time. The
+            Lock is created once, together with the instance, and is shared with every process that receives the
+            instance (the Lock is pickled or inherited together with the instance when it is passed to a child process).
+        _array: Stores the connected shared numpy array. This attribute is set to None when the class is not connected
+            to the shared memory buffer, so it also tracks whether the class is connected.
+        _version: Stores the one-element numpy array that exposes the seqlock version counter stored at the beginning
+            of the shared memory buffer.
+        _typed_view: Stores the typed memoryview of the array data, if the array datatype can be represented by a
+            native memoryview format. The view is used to read single elements directly as Python objects, bypassing
+            numpy scalar construction.
     """
 
+    # The number of bytes reserved at the beginning of the shared memory buffer for the seqlock version counter. The
+    # counter only needs 8 bytes, but the array data is offset by 16 bytes to keep it aligned for all numpy datatypes.
+    _header_size: int = 16
+
+    # The maximum number of optimistic (lock-free) read attempts before the reader falls back to acquiring the Lock.
+    _max_read_attempts: int = 64
+
+    # Determines whether locked reads can use the seqlock. The seqlock is only safe on strongly-ordered (x86)
+    # processors. Other processors can reorder memory accesses, so reads have to acquire the Lock instead.
+    _lock_free_reads: bool = platform.machine().lower() in {"x86_64", "amd64", "i386", "i486", "i586", "i686", "x86"}
+
+    # The native memoryview (struct) formats that can be indexed to directly produce Python objects.
+    _memoryview_formats: frozenset[str] = frozenset("?bBhHiIlLqQfd")
+
     def __init__(
         self,
         name: str,
@@ -67,11 +111,25 @@ class SharedMemoryArray:
         # the create_array() class method.
         self._name: str = name
         self._shape: tuple[int, ...] = shape
-        self._datatype: np.dtype[Any] = datatype
+        self._datatype: np.dtype[Any] = np.dtype(datatype)
         self._buffer: Optional[SharedMemory] = buffer
         self._lock = Lock()
         self._array: Optional[NDArray[Any]] = None
-        self._is_connected: bool = False
+        self._version: Optional[NDArray[np.uint64]] = None
+        self._typed_view: Optional[memoryview] = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the instance state used to pickle the instance (for example, when passing it to a child process).
+
+        The views of the shared memory buffer are excluded from the pickled state. Otherwise, numpy arrays would be
+        pickled as independent copies of the shared data, and memoryview objects cannot be pickled at all. Child
+        processes create their own views when they call the connect() method.
+        """
+        state = self.__dict__.copy()
+        state["_array"] = None
+        state["_version"] = None
+        state["_typed_view"] = None
+        return state
 
     def __repr__(self) -> str:
         """Generates and returns a class representation string."""
@@ -131,9 +189,10 @@ class SharedMemoryArray:
             console.error(message=message, error=ValueError)
 
         # Creates the shared memory object. This process will raise FileExistsError if an object with this name
-        # already exists. The shared memory object is used as a buffer to store the array data.
+        # already exists. The shared memory object is used as a buffer to store the seqlock version counter, followed
+        # by the array data.
         try:
-            buffer: SharedMemory = SharedMemory(name=name, create=True, size=prototype.nbytes)
+            buffer: SharedMemory = SharedMemory(name=name, create=True, size=cls._header_size + prototype.nbytes)
         except FileExistsError:
             message = (
                 f"Unable to create SharedMemoryArray object using name '{name}', as object with this name already "
@@ -142,37 +201,115 @@ class SharedMemoryArray:
             )
             console.error(message=message, error=FileExistsError)
 
-        # Instantiates a numpy ndarray using the shared memory buffer and copies prototype array data into the shared
-        # array instance.
+        # Copies the prototype array data into the shared memory buffer as raw bytes. Since the shared array always
+        # uses the same datatype as the prototype, this bypasses numpy's assignment machinery (casting and broadcasting
+        # checks) and performs a plain memory copy. Non-contiguous prototypes are first packed into a contiguous array.
         # noinspection PyUnboundLocalVariable
-        shared_array: NDArray[Any] = np.ndarray(shape=prototype.shape, dtype=prototype.dtype, buffer=buffer.buf)
-        shared_array[:] = prototype[:]
+        buffer.buf[cls._header_size : cls._header_size + prototype.nbytes] = np.ascontiguousarray(prototype).view(
+            np.uint8
+        )
 
         # Packages the data necessary to connect to the shared array into the class object.
         shared_memory_array = cls(
             name=name,
-            shape=shared_array.shape,
-            datatype=shared_array.dtype,
+            shape=prototype.shape,
+            datatype=prototype.dtype,
             buffer=buffer,
         )
 
-        # Connects the internal _array of the class object to the shared memory buffer.
+        # Connects the internal _array of the class object to the shared memory buffer. This reuses the buffer handle
+        # created above.
         shared_memory_array.connect()
 
+        # Initializes the seqlock version counter to 0 (no write in progress).
+        shared_memory_array._version[0] = 0  # type: ignore
+
         # Returns the instantiated and connected class object to caller.
         return shared_memory_array
 
+    @classmethod
+    def create_array_group(
+        cls,
+        name: str,
+        prototypes: dict[str, NDArray[Any]],
+    ) -> dict[str, "SharedMemoryArray"]:
+        """Creates a group of SharedMemoryArray class instances, one for each of the input prototype arrays.
+
+        This method is designed for sharing heterogeneous data, such as a boolean flag, a timestamp and a counter.
+        Instead of packing all values into a single array that uses the widest of the required datatypes, each value
+        (field) is stored in a separate array that uses its own datatype. This keeps each field compact and allows
+        polling frequently accessed fields (for example, a 1-byte termination flag) without touching the others.
+
+        Notes:
+            Each array in the group uses a separate shared memory buffer, named by joining the group name and the
+            field name with an underscore. If creating any of the arrays fails, all arrays of the group created so far
+            are disconnected and destroyed before the error is raised.
+
+        Args:
+            name: The name of the array group. Note, the names of all buffers created for the group have to be unique
+                across all processes using the arrays.
+            prototypes: The dictionary that maps the names of the group fields to the numpy ndarray instances that
+                serve as prototypes for the arrays created for each field. All prototypes have to be flat
+                (one-dimensional) numpy arrays.
+
+        Returns:
+            The dictionary that maps the names of the group fields to the configured SharedMemoryArray class
+            instances. Pass the dictionary (or its individual arrays) to each process that needs to access the data.
+
+        Raises:
+            TypeError: If any of the input prototypes is not a numpy ndarray.
+            ValueError: If any of the input prototypes is not flat (one-dimensional).
+            FileExistsError: If a shared memory object with the same name as any of the group buffers already exists.
+        """
+        group: dict[str, SharedMemoryArray] = {}
+        try:
+            for field, prototype in prototypes.items():
+                group[field] = cls.create_array(name=f"{name}_{field}", prototype=prototype)
+        except Exception:
+            # Releases the buffers created before the error, so that they do not leak.
+            for shared_memory_array in group.values():
+                shared_memory_array.disconnect()
+                shared_memory_array.destroy()
+            raise
+
+        return group
+
     def connect(self) -> None:
         """Connects to the shared memory buffer that stores the array data, allowing to access and manipulate the data
         through this class.
 
         This method should be called once for each Python process that uses this class, before calling any other
         methods. It is called automatically as part of the create_array() method runtime.
+
+        Notes:
+            Calling this method for an already connected instance does nothing. If the instance stores an open
+            handle to the shared memory buffer (for example, the handle created by the create_array() method or
+            re-opened when the instance was passed to a child process), the method reuses the handle instead of
+            opening the buffer again.
         """
-        self._buffer = SharedMemory(name=self._name)  # Connects to the buffer
-        # Re-initializes the internal _array with the data from the shared memory buffer.
-        self._array = np.ndarray(shape=self._shape, dtype=self._datatype, buffer=self._buffer.buf)
-        self._is_connected = True
+        # Does not re-connect already connected instances
+        if self._array is not None:
+            return
+
+        # Connects to the buffer, unless the instance already stores an open buffer handle. Closed handles release
+        # their memoryview.
+        if self._buffer is None or self._buffer.buf is None:
+            self._buffer = SharedMemory(name=self._name)
+        # Re-initializes the internal _array with the data from the shared memory buffer. The array data is stored
+        # after the seqlock version counter. Note, np.frombuffer() is not used here, as the arrays it creates keep the
+        # buffer exported for their whole lifetime, which prevents the buffer from being closed when the instance is
+        # garbage-collected.
+        self._array = np.ndarray(
+            shape=self._shape, dtype=self._datatype, buffer=self._buffer.buf, offset=self._header_size
+        )
+        self._version = np.ndarray(shape=(1,), dtype=np.uint64, buffer=self._buffer.buf)
+
+        # If the array datatype has a native memoryview equivalent, also creates a typed memoryview of the array data.
+        # Indexing the memoryview returns Python objects directly, which is considerably faster than extracting the
+        # numpy scalar and converting it to the Python type. Note, the view is created from the numpy array rather than
+        # the shared memory buffer, as views of the buffer would prevent the buffer from being closed.
+        if self._datatype.isnative and self._datatype.char in self._memoryview_formats:
+            self._typed_view = memoryview(self._array)
 
     def disconnect(self) -> None:
         """Disconnects the class from the shared memory buffer.
@@ -183,9 +320,15 @@ class SharedMemoryArray:
             This method does not destroy the shared memory buffer. It only releases the local reference to the shared
             memory buffer, potentially enabling it to be garbage-collected.
         """
-        if self._is_connected and self._buffer is not None:
+        if self._array is not None and self._buffer is not None:
+            # Releases the numpy views of the buffer before closing it. Otherwise, the views would keep pointing to the
+            # unmapped buffer memory.
+            self._array = None
+            self._version = None
+            if self._typed_view is not None:
+                self._typed_view.release()
+                self._typed_view = None
             self._buffer.close()
-            self._is_connected = False
 
     def destroy(self) -> None:
         """Requests the underlying shared memory buffer to be destroyed.
@@ -200,7 +343,7 @@ class SharedMemoryArray:
             This method does not do anything on Windows. Windows automatically garbage-collects the buffers as long as
             they are no longer connected to by any SharedMemoryArray instances.
         """
-        if not self._is_connected and self._buffer is not None:
+        if self._array is None and self._buffer is not None:
             self._buffer.unlink()
 
     def _convert_to_slice(self, index: tuple[int, ...]) -> tuple[int, int | None]:
@@ -244,9 +387,12 @@ class SharedMemoryArray:
 
     @contextmanager
     def _optional_lock(self, with_lock: bool) -> Generator[Any, Any, None]:
-        """Conditionally acquires the lock if the caller instructs the manager to do so.
+        """Conditionally acquires the lock and marks the array as being written to if the caller instructs the manager
+        to do so.
 
-        This is used to make locking optional for all data manipulation methods, improving class flexibility.
+        This is used to make locking optional for all data writing methods, improving class flexibility. When the lock
+        is acquired, the manager also advances the seqlock version counter before and after the managed context, so
+        that concurrent readers can detect the write.
 
         Args:
             with_lock: Determine if the context should be run with or without the multiprocessing lock object.
@@ -256,11 +402,89 @@ class SharedMemoryArray:
 
         """
         if with_lock:
+            version: NDArray[np.uint64] = self._version  # type: ignore
             with self._lock:
-                yield
+                # Odd versions indicate that a write is in progress.
+                version[0] += 1
+                try:
+                    yield
+                finally:
+                    # Even versions indicate that the array data is consistent.
+                    version[0] += 1
         else:
             yield
 
+    def _copy_data(
+        self,
+        key: int | slice | NDArray[np.intp],
+        with_lock: bool,
+        out: Optional[NDArray[Any]] = None,
+        source: Optional[memoryview] = None,
+    ) -> Any:
+        """Copies the requested element or slice of the shared array, optionally guaranteeing that the copy is
+        consistent with respect to concurrent locked writes.
+
+        When consistency is requested, this method implements the reader side of the seqlock. It records the version
+        counter, copies the data and re-reads the counter. If a write was in progress (odd version) or has completed
+        (changed version) while the data was being copied, the copy is discarded and the procedure is repeated. This
+        does not require acquiring the multiprocessing Lock, unless the procedure fails for the maximum allowed number
+        of attempts. In that case, the method acquires the Lock to block writers and copies the data under the Lock.
+        On weakly-ordered processors, where the seqlock is not safe, the method always copies the data under the Lock.
+
+        Args:
+            key: The integer index of the element to copy, the slice object that specifies the slice to copy, or the
+                array of integer indices of the elements to copy.
+            with_lock: Determines whether to guarantee the consistency of the copied data.
+            out: Optional. The pre-allocated numpy array to copy the slice data into. If provided, the method does
+                not allocate a new array for the copied data.
+            source: Optional. The typed memoryview to read the data from instead of the shared numpy array. This is
+                used to read single elements as Python objects.
+
+        Returns:
+            The numpy scalar (or the Python object, if the source memoryview is provided) that stores the copy of the
+            requested element (integer keys). The independent copy of the requested array slice or the 'out' array,
+            if it is provided (slice keys). The independent array that stores the requested elements (index array
+            keys).
+        """
+        array: Any = self._array if source is None else source
+
+        def _copy() -> Any:
+            """Copies the requested data from the shared array."""
+            # Indexing an element returns a numpy scalar and indexing with an index array returns a new array. Both are
+            # already independent of the shared buffer, so only slices (views) have to be copied.
+            if out is None:
+                return array[key].copy() if type(key) is slice else array[key]
+            np.copyto(out, array[key], casting="no")
+            return out
+
+        if not with_lock:
+            return _copy()
+
+        # On weakly-ordered processors, the seqlock cannot guarantee consistency, so the data is always copied under the
+        # Lock.
+        if not self._lock_free_reads:
+            with self._lock:
+                return _copy()
+
+        version: NDArray[np.uint64] = self._version  # type: ignore
+        for _ in range(self._max_read_attempts):
+            initial_version = version.item(0)
+
+            # If a write is in progress, waits for it to complete before copying the data.
+            if initial_version & 1:
+                continue
+
+            data = _copy()
+
+            # If the version did not change while the data was being copied, the copy is consistent.
+            if version.item(0) == initial_version:
+                return data
+
+        # If optimistic reads keep colliding with writes, acquires the writer Lock. This blocks all locked writes until
+        # the data is copied.
+        with self._lock:
+            return _copy()
+
     def _verify_indices(self, start: int, stop: Optional[int]) -> tuple[int, Optional[int]]:
         """Converts start and stop indices used to slice the shared numpy array to positive values (if needed) and
         verifies them against array boundaries.
@@ -320,7 +544,56 @@ class SharedMemoryArray:
 
         return start, stop
 
-    def read_data(self, index: int | tuple[int, ...], *, convert_output: bool = False, with_lock: bool = True) -> Any:
+    def _verify_batch_indices(self, indices: Iterable[int] | NDArray[Any]) -> NDArray[np.intp]:
+        """Converts the input collection of indices used to access scattered elements of the shared numpy array into a
+        numpy array and verifies the indices against array boundaries.
+
+        Args:
+            indices: The collection of integer indices to verify. Can contain positive and negative indices.
+
+        Returns:
+            The one-dimensional numpy array that stores the verified indices.
+
+        Raises:
+            ValueError: If the input indices cannot be represented as a one-dimensional array of integers.
+            IndexError: If any of the input indices is outside the array boundaries.
+        """
+        index_array = np.asarray(indices)
+
+        # Empty collections do not have a (numeric) datatype, so they are converted to an empty index array.
+        if index_array.size == 0 and index_array.ndim == 1:
+            return np.empty(0, dtype=np.intp)
+
+        if index_array.ndim != 1 or index_array.dtype.kind not in "iu":
+            message = (
+                f"Unable to access the data of the {self.name} SharedMemoryArray class instance using batch indices. "
+                f"Expected a one-dimensional collection of integer indices, but encountered an array with shape "
+                f"{index_array.shape} and datatype {index_array.dtype} instead."
+            )
+            console.error(message=message, error=ValueError)
+
+        # Negative indices are allowed, so the valid index range spans from -length to length - 1.
+        array_length = self.shape[0]
+        minimum = int(index_array.min())
+        maximum = int(index_array.max())
+        if minimum < -array_length or maximum >= array_length:
+            message = (
+                f"Unable to retrieve the data from {self.name} SharedMemoryArray class instance using batch indices. "
+                f"The index {minimum if minimum < -array_length else maximum} is outside the valid index range "
+                f"({-array_length}:{array_length - 1})."
+            )
+            console.error(message=message, error=IndexError)
+
+        return index_array.astype(np.intp, copy=False)
+
+    def read_data(
+        self,
+        index: int | tuple[int, ...],
+        *,
+        convert_output: bool = False,
+        with_lock: bool = True,
+        out: Optional[NDArray[Any]] = None,
+    ) -> Any:
         """Reads data from the shared memory array at the specified slice or index.
 
         This method allows flexibly extracting slices and single values from the shared memory array wrapped by the
@@ -333,56 +606,83 @@ class SharedMemoryArray:
                 required. Stop index is excluded from the returned data slice (last returned index is stop-1).
             convert_output: Determines whether to convert the retrieved data into the closest Python datatype or to
                 return it as the numpy datatype.
-            with_lock: Determines whether to acquire the multiprocessing Lock before reading the data. Acquiring the
-                lock prevents collisions with other python processes, but this may not be necessary for some use cases.
+            with_lock: Determines whether to ensure that the data is not modified by a (locked) write operation while
+                it is being read. This prevents collisions with other python processes, but this may not be necessary
+                for some use cases. Note, on x86 processors, reading the data does not acquire the multiprocessing
+                Lock, so concurrent reads never block each other. Setting this to False opts into unlocked reads, which
+                are the fastest way to poll single elements, but may observe torn values (see class notes).
+            out: Optional. The pre-allocated numpy array to copy the data into, when reading slices. The array has to
+                use the same datatype as the shared array and match the length of the requested slice. Use this
+                argument to avoid allocating a new array for each read of the same slice. Ignored for integer indices.
 
         Returns:
             The data at the specified index or slice. When a single data-value is extracted, it is returned as a
-            scalar. When multiple data-values are extracted, they are returned as an iterable.
+            scalar. When multiple data-values are extracted, they are returned as an iterable. If the 'out' array is
+            provided, it is returned (or converted to a list, if convert_output is True), regardless of its size.
 
         Raises:
             RuntimeError: If the class instance is not connected to a shared memory buffer.
             ValueError: If the input index tuple contains an invalid number of elements to parse it as slice start and
                 stop values. If using slice indices and start index is greater than stop index after indices are
-                converted to positive numbers (this is done internally, input indices can be negative).
+                converted to positive numbers (this is done internally, input indices can be negative). If the 'out'
+                array does not match the datatype of the shared array or the length of the requested slice.
             IndexError: If the input index or slice is outside the array boundaries.
         """
 
         # Ensures the class is connected to the shared memory buffer
-        if not self._is_connected or self._array is None:
-            message: str = (
-                f"Unable to access the data stored in the {self.name} SharedMemoryArray instance, as the class is not "
-                f"connected to the shared memory buffer. Use connect() method prior to calling other class methods."
-            )
-            console.error(message=message, error=RuntimeError)
+        if self._array is None:
+            self._raise_not_connected()
 
-        # If index is a tuple, decomposes it into slice operands to use on the array
+        # If index is a tuple, decomposes it into slice operands to use on the array. Converts both indices to be
+        # positive and verifies that they are within the array boundaries and not malformed.
         start: int = 0
         stop: Optional[int] = None
         if isinstance(index, tuple):
             # noinspection PyTypeChecker
             start, stop = self._convert_to_slice(index=index)
-        # To optimize variable use, also converts single indices to start / stop notation
+            start, stop = self._verify_indices(start, stop)
+        # To optimize variable use, also converts single indices to start / stop notation. Single indices are verified
+        # inline, as this is the most common use case. The (slower) verification method is only called to raise the
+        # appropriate error if the index is outside the array boundaries.
         elif isinstance(index, int):
-            start = index
-            stop = index + 1
+            # Converts the index to a plain integer. Otherwise, boolean indices (bool is a subclass of int) would be
+            # interpreted by numpy as boolean masks, rather than element indices.
+            start = int(index)
+            if start < 0:
+                start += self._shape[0]
+            if not 0 <= start < self._shape[0]:
+                self._verify_indices(index, index + 1)
+            stop = start + 1
         else:
-            message = (
-                f"Unable to read data from {self.name} SharedMemoryArray class instance. Expected an integer index or "
-                f"a tuple of two integers, but encountered '{index}' of type {type(index).__name__} instead."
-            )
-            console.error(message=message, error=ValueError)
-
-        # Converts both indices to be positive and verifies that they are within the array boundaries and not malformed
-        start, stop = self._verify_indices(start, stop)
-
-        # Extracts the requested data. The data is copied locally to prevent any modifications to the underlying
-        # array object.
-        data: NDArray[Any]
-        # Depending on the value of the 'with_lock' argument, this either acquires a Lock or runs without a lock.
-        with self._optional_lock(with_lock=with_lock):
-            # noinspection PyTestUnpassedFixture
-            data = self._array[start:stop].copy()  # type: ignore
+            self._raise_index_type_error(index=index, operation="read data from")
+
+        # Single-element reads extract the numpy scalar directly, without constructing and then unpacking a
+        # one-element array. The data is copied locally to prevent any modifications to the underlying array object.
+        # Depending on the value of the 'with_lock' argument, this either ensures that the data does not change while
+        # it is being copied or copies the data without any checks.
+        if isinstance(index, int):
+            # If the output has to be converted to Python datatype, reads it from the typed memoryview (if
+            # available), which produces Python objects directly.
+            typed_view = self._typed_view
+            if convert_output and typed_view is not None:
+                return self._copy_data(key=start, with_lock=with_lock, source=typed_view)
+            value = self._copy_data(key=start, with_lock=with_lock)
+            return value.item() if convert_output else value
+
+        # If the output array is provided, ensures it can store the requested slice without casting or reshaping
+        if out is not None:
+            slice_length = (self.shape[0] if stop is None else stop) - start
+            if (
+                not isinstance(out, np.ndarray)
+                or out.shape != (slice_length,)
+                or (out.dtype is not self._datatype and out.dtype != self._datatype)
+            ):
+                self._raise_out_error(out=out, slice_length=slice_length)
+
+            data: NDArray[Any] = self._copy_data(key=slice(start, stop), with_lock=with_lock, out=out)
+            return data.tolist() if convert_output else data
+
+        data = self._copy_data(key=slice(start, stop), with_lock=with_lock)
 
         # Determines whether the data can be returned as a scalar or iterable and whether it needs to be converted to
         # Python datatype or returned as numpy datatype.
@@ -396,6 +696,44 @@ class SharedMemoryArray:
         else:
             return data[0]
 
+    def read_batch(
+        self,
+        indices: Iterable[int] | NDArray[Any],
+        *,
+        convert_output: bool = False,
+        with_lock: bool = True,
+    ) -> NDArray[Any] | list[Any]:
+        """Reads the elements stored at the specified (scattered) indices of the shared memory array.
+
+        This method reads all requested elements in a single operation. Use it instead of calling read_data() in a loop
+        when reading multiple elements that do not form a contiguous slice, as it only pays the method call and
+        consistency check overhead once.
+
+        Args:
+            indices: The collection (list, tuple or numpy array) of integer indices to read. Indices can be negative and
+                can repeat. The elements are returned in the same order as the indices.
+            convert_output: Determines whether to convert the retrieved data into a list of Python objects or to return
+                it as a numpy array.
+            with_lock: Determines whether to ensure that the data is not modified by a (locked) write operation while
+                it is being read.
+
+        Returns:
+            The numpy array that stores the requested elements or the list of the same elements converted to Python
+            datatypes, if convert_output is True.
+
+        Raises:
+            RuntimeError: If the class instance is not connected to a shared memory buffer.
+            ValueError: If the input indices cannot be represented as a one-dimensional array of integers.
+            IndexError: If any of the input indices is outside the array boundaries.
+        """
+        # Ensures the class is connected to the shared memory buffer
+        if self._array is None:
+            self._raise_not_connected()
+
+        index_array = self._verify_batch_indices(indices=indices)
+        data: NDArray[Any] = self._copy_data(key=index_array, with_lock=with_lock)
+        return data.tolist() if convert_output else data
+
     def write_data(
         self,
         index: int | tuple[int, ...],
@@ -426,32 +764,31 @@ class SharedMemoryArray:
             IndexError: If the input index or slice is outside the array boundaries.
         """
         # Ensures the class is connected to the shared memory buffer
-        if not self._is_connected or self._array is None:
-            message: str = (
-                f"Unable to access the data stored in the {self.name} SharedMemoryArray instance, as the class is not "
-                f"connected to the shared memory buffer. Use connect() method prior to calling other class methods."
-            )
-            console.error(message=message, error=RuntimeError)
+        if self._array is None:
+            self._raise_not_connected()
 
-        # If index is a tuple, decomposes it into slice operands to use on the array
+        # If index is a tuple, decomposes it into slice operands to use on the array. Converts both indices to be
+        # positive and verifies that they are within the array boundaries and not malformed.
         start: int = 0
         stop: Optional[int] = None
         if isinstance(index, tuple):
             # noinspection PyTypeChecker
             start, stop = self._convert_to_slice(index=index)
-        # To optimize variable use, also converts single indices to start / stop notation
+            start, stop = self._verify_indices(start, stop)
+        # To optimize variable use, also converts single indices to start / stop notation. Single indices are verified
+        # inline, as this is the most common use case. The (slower) verification method is only called to raise the
+        # appropriate error if the index is outside the array boundaries.
         elif isinstance(index, int):
-            start = index
-            stop = index + 1
+            # Converts the index to a plain integer. Otherwise, boolean indices (bool is a subclass of int) would be
+            # interpreted by numpy as boolean masks, rather than element indices.
+            start = int(index)
+            if start < 0:
+                start += self._shape[0]
+            if not 0 <= start < self._shape[0]:
+                self._verify_indices(index, index + 1)
+            stop = start + 1
         else:
-            message = (
-                f"Unable to write data to {self.name} SharedMemoryArray class instance. Expected an integer index or "
-                f"a tuple of two integers, but encountered '{index}' of type {type(index).__name__} instead."
-            )
-            console.error(message=message, error=ValueError)
-
-        # Converts both indices to be positive and verifies that they are within the array boundaries and not malformed
-        start, stop = self._verify_indices(start, stop)
+            self._raise_index_type_error(index=index, operation="write data to")
 
         # If the input data is not a numpy array, converts it to the numpy array using the same datatype as the one
         # used by the shared memory array
@@ -459,21 +796,133 @@ class SharedMemoryArray:
             if not isinstance(data, np.ndarray):
                 # The only difference between iterable and scalar is that scalars are first cast as a list
                 if isinstance(data, Iterable):
-                    data = np.array(object=data, dtype=self.datatype)
+                    data = np.array(object=data, dtype=self._datatype)
                 else:
-                    data = np.array(object=[data], dtype=self.datatype)
+                    data = np.array(object=[data], dtype=self._datatype)
+
+            # Otherwise, if the input array uses a different datatype, casts it to the shared array datatype. This is
+            # done before acquiring the lock to keep the casting out of the critical section. The identity check
+            # resolves the common case of arrays that already use the shared array datatype without the (slower)
+            # dtype equality comparison.
+            elif data.dtype is not self._datatype and data.dtype != self._datatype:
+                data = data.astype(self._datatype)
 
             # Writes the data to the array, optionally using the lock.
             with self._optional_lock(with_lock=with_lock):
                 self._array[start:stop] = data  # type: ignore
         # Catches and redirects ValueErrors, which is used by numpy to indicate conversion errors.
         except ValueError as e:
-            message = (
-                f"Unable write data to {self.name} SharedMemoryArray class instance with index {index}. Encountered "
-                f"the following error when converting the data to the array datatype ({self.datatype}) and writing it "
-                f"to the array: {e}."
-            )
-            console.error(message=message, error=ValueError)
+            self._raise_write_error(index=index, error=e)
+
+    def write_batch(
+        self,
+        indices: Iterable[int] | NDArray[Any],
+        data: Union[NDArray[Any], list[Any], tuple[Any], int, float, bool, str],
+        with_lock: bool = True,
+    ) -> None:
+        """Writes data to the specified (scattered) indices of the shared memory array.
+
+        This method writes to all requested elements in a single operation. Use it instead of calling write_data() in a
+        loop when writing multiple elements that do not form a contiguous slice, as it only acquires the Lock once.
+
+        Args:
+            indices: The collection (list, tuple or numpy array) of integer indices to write to. Indices can be
+                negative. If an index repeats, the element is set to the last value written to it.
+            data: The data to write to the shared numpy array. Has to either contain one value per index or a single
+                value to write to all indices. The data has to be convertible to the datatype of the array.
+            with_lock: Determines whether to acquire the multiprocessing Lock before writing the data. Acquiring the
+                lock prevents collisions with other python processes, but this may not be necessary for some use cases.
+
+        Raises:
+            RuntimeError: If the class instance is not connected to a shared memory buffer.
+            ValueError: If the input indices cannot be represented as a one-dimensional array of integers. If the
+                method is unable to convert the input data into the array format, or if writing data to the array
+                fails.
+            IndexError: If any of the input indices is outside the array boundaries.
+        """
+        # Ensures the class is connected to the shared memory buffer
+        if self._array is None:
+            self._raise_not_connected()
+
+        index_array = self._verify_batch_indices(indices=indices)
+
+        # Converts the input data to the array datatype before acquiring the lock, to keep the conversion out of the
+        # critical section.
+        try:
+            if not isinstance(data, np.ndarray) or (data.dtype is not self._datatype and data.dtype != self._datatype):
+                data = np.asarray(data, dtype=self._datatype)
+
+            # Writes the data to the array, optionally using the lock.
+            with self._optional_lock(with_lock=with_lock):
+                self._array[index_array] = data  # type: ignore
+        # Catches and redirects ValueErrors, which is used by numpy to indicate conversion errors.
+        except ValueError as e:
+            self._raise_write_error(index=tuple(index_array.tolist()), error=e)
+
+    def _raise_not_connected(self) -> None:
+        """Raises the error that communicates that the class is not connected to the shared memory buffer.
+
+        Raises:
+            RuntimeError: Always.
+        """
+        message = (
+            f"Unable to access the data stored in the {self.name} SharedMemoryArray instance, as the class is not "
+            f"connected to the shared memory buffer. Use connect() method prior to calling other class methods."
+        )
+        console.error(message=message, error=RuntimeError)
+
+    def _raise_index_type_error(self, index: Any, operation: str) -> None:
+        """Raises the error that communicates that the input index has an unsupported type.
+
+        Args:
+            index: The invalid index passed to the read or write method.
+            operation: The description of the failed operation, used in the error message.
+
+        Raises:
+            ValueError: Always.
+        """
+        message = (
+            f"Unable to {operation} {self.name} SharedMemoryArray class instance. Expected an integer index or a tuple "
+            f"of two integers, but encountered '{index}' of type {type(index).__name__} instead."
+        )
+        console.error(message=message, error=ValueError)
+
+    def _raise_out_error(self, out: Any, slice_length: int) -> None:
+        """Raises the error that communicates that the 'out' array cannot store the requested slice of the shared array.
+
+        Args:
+            out: The invalid 'out' object passed to the read_data() method.
+            slice_length: The length of the requested slice.
+
+        Raises:
+            ValueError: Always.
+        """
+        message = (
+            f"Unable to read data from {self.name} SharedMemoryArray class instance into the provided 'out' array. "
+            f"Expected a numpy ndarray with shape ({slice_length},) and datatype {self._datatype}, but encountered "
+            f"{type(out).__name__} with shape {np.shape(out)} and datatype {getattr(out, 'dtype', None)} instead."
+        )
+        console.error(message=message, error=ValueError)
+
+    def _raise_write_error(self, index: int | tuple[int, ...], error: ValueError) -> None:
+        """Raises the error that communicates the failure to convert or write the data to the shared array.
+
+        This method is kept separate from the write_data() and write_batch() methods, as it is only used when writing
+        the data fails. This keeps the error message construction out of the writing methods' bodies.
+
+        Args:
+            index: The index or slice tuple used by the failed write operation.
+            error: The ValueError raised by numpy when converting or writing the data.
+
+        Raises:
+            ValueError: Always.
+        """
+        message = (
+            f"Unable write data to {self.name} SharedMemoryArray class instance with index {index}. Encountered "
+            f"the following error when converting the data to the array datatype ({self.datatype}) and writing it "
+            f"to the array: {error}."
+        )
+        console.error(message=message, error=ValueError)
 
     @property
     def datatype(
@@ -498,4 +947,4 @@ class SharedMemoryArray:
 
         Connection to the shared memory buffer is required for most class methods to work.
         """
-        return self._is_connected
+        return self._array is not None
@@ -1,4 +1,4 @@
-from typing import Any, Generator
+from typing import Any, Iterable, Generator
 from multiprocessing.shared_memory import SharedMemory
 
 import numpy as np
@@ -18,13 +18,36 @@ class SharedMemoryArray:
 
     This class should only be instantiated inside the main process via its create_array() method. Do not attempt to
     instantiate the class manually. All child processes working with this class should use the connect() method to
-    connect to the shared array wrapped by the class before calling any other method.
+    connect to the shared array wrapped by the class before calling any other method. The instance has to be passed to
+    the child processes (for example, as an argument of the Process), as this is how all processes receive the same
+    multiprocessing Lock.
 
     Notes:
         Shared memory objects are garbage-collected differently depending on the host OS. On Windows, garbage collection
         is handed off to the OS and cannot be enforced manually. On Unix (OSx and Linux), the buffer can be
         garbage-collected via appropriate commands.
 
+        Locked access to the array uses a sequence lock (seqlock). The first bytes of the shared buffer store a version
+        counter, which writers make odd before modifying the array and even after they are done. Writers serialize
+        each other with the multiprocessing Lock, but readers never acquire it. Instead, readers copy the data and
+        retry the copy if the version changed (or was odd) while the data was being copied. This allows any number of
+        processes to read the array concurrently without contending for the Lock. If the data keeps changing for too
+        many consecutive attempts, the reader falls back to acquiring the Lock, which guarantees that readers do not
+        spin indefinitely under heavy write load.
+
+        The seqlock relies on the processor preserving the order of memory loads and stores, which is only guaranteed
+        by strongly-ordered (x86 and x86-64) processors. Python does not expose memory fences, so on weakly-ordered
+        processors (for example, ARM64, including Apple Silicon Macs) a reader could observe the unchanged version
+        counter while accepting partially written data. On these platforms, locked reads always acquire the Lock, which
+        acts as a full memory barrier, and concurrent reads block each other.
+
+        Reads that use with_lock=False skip the seqlock (and the Lock) entirely. This is an explicit opt-in for
+        latency-critical polling of single elements, such as boolean flags or counters. The array data is aligned to
+        its element size in the shared buffer, so on most platforms such elements are loaded by a single machine
+        instruction. However, neither Python nor numpy guarantee this, so unlocked reads may observe torn values and
+        should only be used when this is acceptable. Writes that use with_lock=True always acquire the Lock, as they
+        also have to advance the version counter shared by all writers.
+
     Args:
         name: The descriptive name to use for the shared memory array. The OS uses names to identify shared
             memory objects and have to be unique.
@@ -38,22 +61,40 @@ class SharedMemoryArray:
         _shape: Stores the shape of the numpy array used to represent the buffered data.
         _datatype: Stores the datatype of the numpy array used to represent the buffered data.
         _buffer: The Shared Memory buffer object used to store the shared array data.
-        _lock: A Lock object used to prevent multiple processes from working with the shared array data at the same
-            time.
-        _array: Stores the connected shared numpy array.
-        _is_connected: Tracks whether the shared memory array wrapped by this class has been connected to.
+        _lock: A Lock object used to prevent multiple processes from writing to the shared array at the same time. The
+            Lock is created once, together with the instance, and is shared with every process that receives the
+            instance (the Lock is pickled or inherited together with the instance when it is passed to a child process).
+        _array: Stores the connected shared numpy array. This attribute is set to None when the class is not connected
+            to the shared memory buffer, so it also tracks whether the class is connected.
+        _version: Stores the one-element numpy array that exposes the seqlock version counter stored at the beginning
+            of the shared memory buffer.
+        _typed_view: Stores the typed memoryview of the array data, if the array datatype can be represented by a
+            native memoryview format. The view is used to read single elements directly as Python objects, bypassing
+            numpy scalar construction.
     """
 
+    _header_size: int
+    _max_read_attempts: int
+    _lock_free_reads: bool
+    _memoryview_formats: frozenset[str]
     _name: Incomplete
     _shape: Incomplete
     _datatype: Incomplete
     _buffer: Incomplete
     _lock: Incomplete
     _array: Incomplete
-    _is_connected: bool
+    _version: Incomplete
+    _typed_view: memoryview | None
     def __init__(
         self, name: str, shape: tuple[int, ...], datatype: np.dtype[Any], buffer: SharedMemory | None
     ) -> None: ...
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the instance state used to pickle the instance (for example, when passing it to a child process).
+
+        The views of the shared memory buffer are excluded from the pickled state. Otherwise, numpy arrays would be
+        pickled as independent copies of the shared data, and memoryview objects cannot be pickled at all. Child
+        processes create their own views when they call the connect() method.
+        """
     def __repr__(self) -> str:
         """Generates and returns a class representation string."""
     @classmethod
@@ -85,12 +126,48 @@ class SharedMemoryArray:
             FileExistsError: If a shared memory object with the same name as the input 'name' argument value already
                 exists.
         """
+    @classmethod
+    def create_array_group(cls, name: str, prototypes: dict[str, NDArray[Any]]) -> dict[str, SharedMemoryArray]:
+        """Creates a group of SharedMemoryArray class instances, one for each of the input prototype arrays.
+
+        This method is designed for sharing heterogeneous data, such as a boolean flag, a timestamp and a counter.
+        Instead of packing all values into a single array that uses the widest of the required datatypes, each value
+        (field) is stored in a separate array that uses its own datatype. This keeps each field compact and allows
+        polling frequently accessed fields (for example, a 1-byte termination flag) without touching the others.
+
+        Notes:
+            Each array in the group uses a separate shared memory buffer, named by joining the group name and the
+            field name with an underscore. If creating any of the arrays fails, all arrays of the group created so far
+            are disconnected and destroyed before the error is raised.
+
+        Args:
+            name: The name of the array group. Note, the names of all buffers created for the group have to be unique
+                across all processes using the arrays.
+            prototypes: The dictionary that maps the names of the group fields to the numpy ndarray instances that
+                serve as prototypes for the arrays created for each field. All prototypes have to be flat
+                (one-dimensional) numpy arrays.
+
+        Returns:
+            The dictionary that maps the names of the group fields to the configured SharedMemoryArray class
+            instances. Pass the dictionary (or its individual arrays) to each process that needs to access the data.
+
+        Raises:
+            TypeError: If any of the input prototypes is not a numpy ndarray.
+            ValueError: If any of the input prototypes is not flat (one-dimensional).
+            FileExistsError: If a shared memory object with the same name as any of the group buffers already exists.
+        """
     def connect(self) -> None:
         """Connects to the shared memory buffer that stores the array data, allowing to access and manipulate the data
         through this class.
 
         This method should be called once for each Python process that uses this class, before calling any other
         methods. It is called automatically as part of the create_array() method runtime.
+
+        Notes:
+            Calling this method for an already connected instance does nothing. If the instance stores an open
+            handle to the shared memory buffer (for example, the handle created by the create_array() method or
+            re-opened when the instance was passed to a child process), the method reuses the handle instead of
+            opening the buffer again.
         """
     def disconnect(self) -> None:
         """Disconnects the class from the shared memory buffer.
@@ -129,9 +206,12 @@ class SharedMemoryArray:
             ValueError: If the input tuple contains an invalid number of elements.
         """
     def _optional_lock(self, with_lock: bool) -> Generator[Any, Any, None]:
-        """Conditionally acquires the lock if the caller instructs the manager to do so.
+        """Conditionally acquires the lock and marks the array as being written to if the caller instructs the manager
+        to do so.
 
-        This is used to make locking optional for all data manipulation methods, improving class flexibility.
+        This is used to make locking optional for all data writing methods, improving class flexibility. When the lock
+        is acquired, the manager also advances the seqlock version counter before and after the managed context, so
+        that concurrent readers can detect the write.
 
         Args:
             with_lock: Determine if the context should be run with or without the multiprocessing lock object.
@@ -140,6 +220,38 @@ class SharedMemoryArray:
               The context that has acquired the lock or an empty context if lock is not required.
 
         """
+    def _copy_data(
+        self,
+        key: int | slice | NDArray[np.intp],
+        with_lock: bool,
+        out: NDArray[Any] | None = None,
+        source: memoryview | None = None,
+    ) -> Any:
+        """Copies the requested element or slice of the shared array, optionally guaranteeing that the copy is
+        consistent with respect to concurrent locked writes.
+
+        When consistency is requested, this method implements the reader side of the seqlock. It records the version
+        counter, copies the data and re-reads the counter. If a write was in progress (odd version) or has completed
+        (changed version) while the data was being copied, the copy is discarded and the procedure is repeated. This
+        does not require acquiring the multiprocessing Lock, unless the procedure fails for the maximum allowed number
+        of attempts. In that case, the method acquires the Lock to block writers and copies the data under the Lock.
+        On weakly-ordered processors, where the seqlock is not safe, the method always copies the data under the Lock.
+
+        Args:
+            key: The integer index of the element to copy, the slice object that specifies the slice to copy, or the
+                array of integer indices of the elements to copy.
+            with_lock: Determines whether to guarantee the consistency of the copied data.
+            out: Optional. The pre-allocated numpy array to copy the slice data into. If provided, the method does
+                not allocate a new array for the copied data.
+            source: Optional. The typed memoryview to read the data from instead of the shared numpy array. This is
+                used to read single elements as Python objects.
+
+        Returns:
+            The numpy scalar (or the Python object, if the source memoryview is provided) that stores the copy of the
+            requested element (integer keys). The independent copy of the requested array slice or the 'out' array,
+            if it is provided (slice keys). The independent array that stores the requested elements (index array
+            keys).
+        """
     def _verify_indices(self, start: int, stop: int | None) -> tuple[int, int | None]:
         """Converts start and stop indices used to slice the shared numpy array to positive values (if needed) and
         verifies them against array boundaries.
@@ -157,7 +269,28 @@ class SharedMemoryArray:
             ValueError: If start index is larger than the stop index after both are converted to positive numbers
             IndexError: If either of the two indices is outside the array boundaries.
         """
-    def read_data(self, index: int | tuple[int, ...], *, convert_output: bool = False, with_lock: bool = True) -> Any:
+    def _verify_batch_indices(self, indices: Iterable[int] | NDArray[Any]) -> NDArray[np.intp]:
+        """Converts the input collection of indices used to access scattered elements of the shared numpy array into a
+        numpy array and verifies the indices against array boundaries.
+
+        Args:
+            indices: The collection of integer indices to verify. Can contain positive and negative indices.
+
+        Returns:
+            The one-dimensional numpy array that stores the verified indices.
+
+        Raises:
+            ValueError: If the input indices cannot be represented as a one-dimensional array of integers.
+            IndexError: If any of the input indices is outside the array boundaries.
+        """
+    def read_data(
+        self,
+        index: int | tuple[int, ...],
+        *,
+        convert_output: bool = False,
+        with_lock: bool = True,
+        out: NDArray[Any] | None = None,
+    ) -> Any:
         """Reads data from the shared memory array at the specified slice or index.
 
         This method allows flexibly extracting slices and single values from the shared memory array wrapped by the
@@ -170,20 +303,58 @@ class SharedMemoryArray:
                 required. Stop index is excluded from the returned data slice (last returned index is stop-1).
             convert_output: Determines whether to convert the retrieved data into the closest Python datatype or to
                 return it as the numpy datatype.
-            with_lock: Determines whether to acquire the multiprocessing Lock before reading the data. Acquiring the
-                lock prevents collisions with other python processes, but this may not be necessary for some use cases.
+            with_lock: Determines whether to ensure that the data is not modified by a (locked) write operation while
+                it is being read. This prevents collisions with other python processes, but this may not be necessary
+                for some use cases. Note, on x86 processors, reading the data does not acquire the multiprocessing
+                Lock, so concurrent reads never block each other. Setting this to False opts into unlocked reads, which
+                are the fastest way to poll single elements, but may observe torn values (see class notes).
+            out: Optional. The pre-allocated numpy array to copy the data into, when reading slices. The array has to
+                use the same datatype as the shared array and match the length of the requested slice. Use this
+                argument to avoid allocating a new array for each read of the same slice. Ignored for integer indices.
 
         Returns:
             The data at the specified index or slice. When a single data-value is extracted, it is returned as a
-            scalar. When multiple data-values are extracted, they are returned as an iterable.
+            scalar. When multiple data-values are extracted, they are returned as an iterable. If the 'out' array is
+            provided, it is returned (or converted to a list, if convert_output is True), regardless of its size.
 
         Raises:
             RuntimeError: If the class instance is not connected to a shared memory buffer.
             ValueError: If the input index tuple contains an invalid number of elements to parse it as slice start and
                 stop values. If using slice indices and start index is greater than stop index after indices are
-                converted to positive numbers (this is done internally, input indices can be negative).
+                converted to positive numbers (this is done internally, input indices can be negative). If the 'out'
+                array does not match the datatype of the shared array or the length of the requested slice.
             IndexError: If the input index or slice is outside the array boundaries.
         """
+    def read_batch(
+        self,
+        indices: Iterable[int] | NDArray[Any],
+        *,
+        convert_output: bool = False,
+        with_lock: bool = True,
+    ) -> NDArray[Any] | list[Any]:
+        """Reads the elements stored at the specified (scattered) indices of the shared memory array.
+
+        This method reads all requested elements in a single operation. Use it instead of calling read_data() in a loop
+        when reading multiple elements that do not form a contiguous slice, as it only pays the method call and
+        consistency check overhead once.
+
+        Args:
+            indices: The collection (list, tuple or numpy array) of integer indices to read. Indices can be negative and
+                can repeat. The elements are returned in the same order as the indices.
+            convert_output: Determines whether to convert the retrieved data into a list of Python objects or to return
+                it as a numpy array.
+            with_lock: Determines whether to ensure that the data is not modified by a (locked) write operation while
+                it is being read.
+
+        Returns:
+            The numpy array that stores the requested elements or the list of the same elements converted to Python
+            datatypes, if convert_output is True.
+
+        Raises:
+            RuntimeError: If the class instance is not connected to a shared memory buffer.
+            ValueError: If the input indices cannot be represented as a one-dimensional array of integers.
+            IndexError: If any of the input indices is outside the array boundaries.
+        """
     def write_data(
         self,
         index: int | tuple[int, ...],
@@ -213,6 +384,71 @@ class SharedMemoryArray:
                 converted to positive numbers (this is done internally, input indices can be negative).
             IndexError: If the input index or slice is outside the array boundaries.
         """
+    def write_batch(
+        self,
+        indices: Iterable[int] | NDArray[Any],
+        data: NDArray[Any] | list[Any] | tuple[Any] | int | float | bool | str,
+        with_lock: bool = True,
+    ) -> None:
+        """Writes data to the specified (scattered) indices of the shared memory array.
+
+        This method writes to all requested elements in a single operation. Use it instead of calling write_data() in a
+        loop when writing multiple elements that do not form a contiguous slice, as it only acquires the Lock once.
+
+        Args:
+            indices: The collection (list, tuple or numpy array) of integer indices to write to. Indices can be
+                negative. If an index repeats, the element is set to the last value written to it.
+            data: The data to write to the shared numpy array. Has to either contain one value per index or a single
+                value to write to all indices. The data has to be convertible to the datatype of the array.
+            with_lock: Determines whether to acquire the multiprocessing Lock before writing the data. Acquiring the
+                lock prevents collisions with other python processes, but this may not be necessary for some use cases.
+
+        Raises:
+            RuntimeError: If the class instance is not connected to a shared memory buffer.
+            ValueError: If the input indices cannot be represented as a one-dimensional array of integers. If the
+                method is unable to convert the input data into the array format, or if writing data to the array
+                fails.
+            IndexError: If any of the input indices is outside the array boundaries.
+        """
+    def _raise_not_connected(self) -> None:
+        """Raises the error that communicates that the class is not connected to the shared memory buffer.
+
+        Raises:
+            RuntimeError: Always.
+        """
+    def _raise_index_type_error(self, index: Any, operation: str) -> None:
+        """Raises the error that communicates that the input index has an unsupported type.
+
+        Args:
+            index: The invalid index passed to the read or write method.
+            operation: The description of the failed operation, used in the error message.
+
+        Raises:
+            ValueError: Always.
+        """
+    def _raise_out_error(self, out: Any, slice_length: int) -> None:
+        """Raises the error that communicates that the 'out' array cannot store the requested slice of the shared array.
+
+        Args:
+            out: The invalid 'out' object passed to the read_data() method.
+            slice_length: The length of the requested slice.
+
+        Raises:
+            ValueError: Always.
+        """
+    def _raise_write_error(self, index: int | tuple[int, ...], error: ValueError) -> None:
+        """Raises the error that communicates the failure to convert or write the data to the shared array.
+
+        This method is kept separate from the write_data() and write_batch() methods, as it is only used when writing
+        the data fails. This keeps the error message construction out of the writing methods' bodies.
+
+        Args:
+            index: The index or slice tuple used by the failed write operation.
+            error: The ValueError raised by numpy when converting or writing the data.
+
+        Raises:
+            ValueError: Always.
+        """
     @property
     def datatype(self) -> np.dtype[Any]:
         """Returns the datatype used by the shared memory array."""
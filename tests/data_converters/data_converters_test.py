@@ -1,7 +1,9 @@
 """Contains tests for classes and methods stored inside the data_converters module of the data_converters pacakge."""
 
 import re
+import sys
 import textwrap
+import threading
 
 import numpy as np
 import pytest
@@ -69,6 +71,9 @@ def error_format(message: str) -> str:
         ({"number_lower_limit": 0}, -5, None),
         ({"number_upper_limit": 10}, 15, None),
         ({"allow_float_output": False}, 5.5, None),
+        ({"allow_float_output": False}, 1e20, 10**20),
+        ({"allow_float_output": False}, float("inf"), None),
+        ({"allow_float_output": False}, float("nan"), None),
     ],
 )
 def test_numeric_converter_validate_value(config, input_value, expected) -> None:
@@ -92,6 +97,10 @@ def test_numeric_converter_validate_value(config, input_value, expected) -> None
         15 - Failure for a number below the lower limit.
         16 - Failure for a number above the upper limit
         17 - Failure for a float input with floats not allowed and the input not integer-convertible.
+        18 - Conversion of a large float (outside the exact integer range of floats) into an integer, with float
+            outputs not allowed.
+        19 - Failure for an infinite float input with floats not allowed.
+        20 - Failure for a NaN float input with floats not allowed.
     """
     converter = NumericConverter(**config)
     output = converter.validate_value(input_value)
@@ -99,6 +108,77 @@ def test_numeric_converter_validate_value(config, input_value, expected) -> None
     assert isinstance(output, type(expected))
 
 
+@pytest.mark.parametrize(
+    "config, values",
+    [
+        ({}, np.array([1, -2, 3], dtype=np.int16)),
+        ({"allow_float_output": False}, np.array([[1.0, 1.5], [2.0, -3.25]])),
+        ({"allow_integer_output": False}, [True, False, 7]),
+        ({"number_lower_limit": 0, "number_upper_limit": 10}, np.array([-1, 0, 5.5, 10, 11])),
+        ({"allow_float_output": False, "number_lower_limit": 1}, np.array([0, 1, 2], dtype=np.uint8)),
+        ({}, ["1.5", "x", 2, None]),
+        ({"parse_number_strings": False}, [1, "2"]),
+        ({"number_upper_limit": 5}, np.array(["3", "7"])),
+    ],
+)
+def test_numeric_converter_validate_array(config, values) -> None:
+    """Verifies that the NumericConverter class validate_array() method produces the same results as validating each
+    value with the validate_value() method.
+
+    Evaluates the following scenarios:
+        0 - Validation of an integer array with default configuration.
+        1 - Validation of a two-dimensional float array, with float outputs not allowed.
+        2 - Validation of a boolean and integer list, with integer outputs not allowed.
+        3 - Validation of a mixed integer and float array with limits enforced.
+        4 - Validation of an unsigned integer array with float outputs not allowed and the lower limit enforced.
+        5 - Element-wise validation of a mixed list of strings, numbers and None.
+        6 - Element-wise validation of a mixed list, with string parsing disabled.
+        7 - Element-wise validation of a string array with the upper limit enforced.
+    """
+    converter = NumericConverter(**config)
+    output = converter.validate_array(values)
+
+    array = np.asarray(values)
+    items = array.ravel().tolist() if isinstance(values, np.ndarray) else values
+    expected = [converter.validate_value(value) for value in items]
+    expected_array = np.array([np.nan if value is None else value for value in expected], dtype=np.float64)
+
+    assert output.dtype == np.float64
+    assert output.shape == array.shape
+    np.testing.assert_array_equal(output.ravel(), expected_array)
+
+
+def test_numeric_converter_validate_array_errors() -> None:
+    """Verifies the error-handling behavior of the NumericConverter class validate_array() method."""
+    converter = NumericConverter()
+
+    # Generators and other iterables that are not numpy arrays, lists or tuples are not supported
+    values = (value for value in range(3))
+    message = (
+        f"Unable to validate the input values using the NumericConverter class instance. Expected a numpy "
+        f"array, list or tuple of values, but encountered {values} of type {type(values).__name__}."
+    )
+    with pytest.raises(TypeError, match=error_format(message)):
+        # noinspection PyTypeChecker
+        converter.validate_array(values)
+
+
+def test_numeric_converter_validate_array_differences() -> None:
+    """Verifies the documented differences between the NumericConverter class validate_array() and validate_value()
+    methods.
+    """
+    converter = NumericConverter()
+
+    # The elements of numpy integer arrays are valid, although numpy integer scalars are not
+    assert converter.validate_value(np.int32(5)) is None
+    np.testing.assert_array_equal(converter.validate_array(np.array([5], dtype=np.int32)), [5.0])
+
+    # Integers outside the exact integer range of floats are rounded to the nearest float64 value
+    value = 2**53 + 1
+    assert converter.validate_value(value) == value
+    assert converter.validate_array([value])[0] == float(value)
+
+
 def test_numeric_converter_repr() -> None:
     """Verifies the functionality of NumericConverter class __repr__() method."""
     converter = NumericConverter()
@@ -324,6 +404,7 @@ def test_boolean_converter_properties() -> None:
     converter = BooleanConverter(parse_boolean_equivalents=False)
 
     assert not converter.parse_boolean_equivalents
+    assert BooleanConverter.boolean_equivalents() == (0, 1, "0", "1", "False", "True", "false", "true")
 
 
 @pytest.mark.parametrize(
@@ -354,6 +435,7 @@ def test_boolean_converter_config(config) -> None:
         ({}, 5.5, "None"),
         ({}, True, "None"),
         ({}, False, "None"),
+        ({}, ["None"], "None"),
         ({"parse_none_equivalents": False}, "None", "None"),
         ({"parse_none_equivalents": False}, "none", "None"),
         ({"parse_none_equivalents": False}, "null", "None"),
@@ -413,6 +495,7 @@ def test_none_converter_properties() -> None:
     """Verifies the functionality NoneConverter class accessor properties."""
     converter = NoneConverter(parse_none_equivalents=True)
     assert converter.parse_none_equivalents
+    assert NoneConverter.none_equivalents() == ("None", "Null", "none", "null")
 
 
 @pytest.mark.parametrize(
@@ -697,6 +780,88 @@ def test_python_data_converter_validate_value(config, input_value, expected) ->
     assert isinstance(result, type(expected))
 
 
+def test_python_data_converter_validate_list() -> None:
+    """Verifies the functionality of PythonDataConverter class validate_list() method."""
+    converter = PythonDataConverter(numeric_converter=NumericConverter(allow_float_output=False))
+
+    # Validates flat lists using the same rules as the validate_value() method
+    assert converter.validate_list(["1", 2, 3.0]) == (1, 2, 3)
+    assert converter.validate_list(["1", 2, 3.0]) == converter.validate_value(["1", 2, 3.0])
+
+    # One-element lists are returned as scalars
+    assert converter.validate_list(["5"]) == 5
+
+    # Raises errors for elements that cannot be validated, if configured to do so
+    converter = PythonDataConverter(numeric_converter=NumericConverter(allow_float_output=False), raise_errors=True)
+    with pytest.raises(ValueError):
+        converter.validate_list(["1", "a"])
+
+
+def test_python_data_converter_string_cache() -> None:
+    """Verifies that the PythonDataConverter class caches and reuses the validation results for string inputs."""
+    converter = PythonDataConverter(
+        numeric_converter=NumericConverter(allow_float_output=False),
+        none_converter=NoneConverter(),
+        string_converter=StringConverter(string_options=["yes", "no"]),
+    )
+
+    # Repeated strings are validated once and produce the same results as the first evaluation
+    inputs = ["5", "None", "yes", "maybe", "5", "yes", "maybe", 5.0, True]
+    expected = (5, None, "yes", "Validation/ConversionError", 5, "yes", "Validation/ConversionError", 5, 1)
+    assert converter.validate_value(inputs) == expected
+    assert converter.validate_value(inputs) == expected
+    assert {"5", "yes", "maybe"} <= set(converter._string_results)
+
+    # Verifies that the boolean and None equivalent literals are resolved at initialization, according to the converter
+    # configuration, and are stored separately from the bounded string cache
+    assert converter._literal_results["1"] == (True, 1)
+    assert converter._literal_results["null"] == (True, None)
+    assert converter._literal_results["True"] == (False, None)
+    assert "None" not in converter._string_results
+
+    # Verifies that the cache size is bounded and that the oldest cached results are evicted first
+    converter._string_cache_size = 2
+    converter._string_results.clear()
+    assert converter.validate_value(["1", "2", "3", "4", "null"]) == (1, 2, 3, 4, None)
+    assert list(converter._string_results) == ["3", "4"]
+
+    # Verifies that the literals are never evicted from the cache
+    assert converter._literal_results["1"] == (True, 1)
+    assert converter._literal_results["null"] == (True, None)
+
+
+def test_python_data_converter_string_cache_threads() -> None:
+    """Verifies that multiple threads can share the same PythonDataConverter instance while its string cache is
+    full and evicts cached results.
+    """
+    converter = PythonDataConverter(numeric_converter=NumericConverter(allow_float_output=False))
+    converter._string_cache_size = 2
+
+    # Each thread validates a distinct set of strings, so that every validation evicts a cached result
+    inputs = [[str(value) for value in range(thread, 20000, 8)] for thread in range(8)]
+    results: list = [None] * len(inputs)
+
+    def validate(thread: int) -> None:
+        results[thread] = converter.validate_value(inputs[thread])
+
+    # Forces frequent thread switches to make the threads interleave inside the cache eviction logic
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=validate, args=(thread,)) for thread in range(len(inputs))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    # Threads that raised an error do not store their results
+    for thread, result in enumerate(results):
+        assert result == tuple(range(thread, 20000, 8))
+    assert len(converter._string_results) <= len(inputs) + 2
+
+
 def test_python_data_converter_repr() -> None:
     """Verifies the functionality of PythonDataConverter class __repr__() method."""
     converter = PythonDataConverter(
@@ -1138,6 +1303,30 @@ def test_python_data_converter_validate_value_errors(config, input_value, expect
             "123",
             np.int32(123),
         ),
+        # Tests with auto bit width for iterables that require different minimum bit-widths for each element
+        (
+            {
+                "python_converter": PythonDataConverter(
+                    numeric_converter=NumericConverter(allow_float_output=False), raise_errors=True
+                ),
+                "output_bit_width": "auto",
+                "signed": True,
+            },
+            [1, 300, -5],
+            np.array([1, 300, -5], dtype=np.int16),
+        ),
+        # Tests with auto bit width for floating iterables. All elements are converted directly to the resolved
+        # datatype, without being rounded to the minimum datatype of each element first.
+        (
+            {
+                "python_converter": PythonDataConverter(
+                    numeric_converter=NumericConverter(allow_integer_output=False), raise_errors=True
+                ),
+                "output_bit_width": "auto",
+            },
+            [0.1, 1e10],
+            np.array([0.1, 1e10], dtype=np.float32),
+        ),
     ],
 )
 def test_numpy_data_converter_convert_value_to_numpy(config, input_value, expected_value) -> None:
@@ -1152,6 +1341,8 @@ def test_numpy_data_converter_convert_value_to_numpy(config, input_value, expect
         17-19 - Conversion with auto bit width selection for integers and floats.
         20 - Conversion of mixed types in iterable to integer.
         21 - Conversion of a numeric string to numpy integer.
+        22 - Conversion of an iterable with auto bit width selection that requires promoting the elements.
+        23 - Conversion of a floating iterable with auto bit width selection without intermediate rounding.
     """
     converter = NumpyDataConverter(**config)
     result = converter.convert_value_to_numpy(input_value)
@@ -1177,6 +1368,21 @@ def test_numpy_data_converter_convert_value_to_numpy(config, input_value, expect
             "type (int8). The value does not fit into the requested numpy datatype which can only "
             "accommodate values between -128 and 127.",
         ),
+        # Tests overflow for an element of an iterable
+        (
+            {
+                "python_converter": PythonDataConverter(
+                    numeric_converter=NumericConverter(allow_float_output=False), raise_errors=True
+                ),
+                "output_bit_width": 8,
+                "signed": True,
+            },
+            [1, 128],
+            OverflowError,
+            "Unable to convert the input integer value 128, which is part of the collection [1, 128] to the requested "
+            "type (int8). The value does not fit into the requested numpy datatype which can only "
+            "accommodate values between -128 and 127.",
+        ),
         # Tests overflow for unsigned integer
         (
             {
@@ -1206,6 +1412,45 @@ def test_numpy_data_converter_convert_value_to_numpy(config, input_value, expect
             "requested type (float32). The value does not fit into the requested numpy datatype which can only "
             "accommodate values between",
         ),
+        # Tests nan values in iterables. The position of the nan value in the iterable should not matter.
+        (
+            {
+                "python_converter": PythonDataConverter(
+                    numeric_converter=NumericConverter(allow_integer_output=False), raise_errors=True
+                ),
+                "output_bit_width": 32,
+            },
+            [1.0, float("nan")],
+            OverflowError,
+            "Unable to convert the input floating value nan, which is part of the collection [1.0, nan] to the "
+            "requested type (float32). The value does not fit into the requested numpy datatype which can only "
+            "accommodate values between",
+        ),
+        (
+            {
+                "python_converter": PythonDataConverter(
+                    numeric_converter=NumericConverter(allow_integer_output=False), raise_errors=True
+                ),
+                "output_bit_width": 32,
+            },
+            [float("nan"), 1.0],
+            OverflowError,
+            "Unable to convert the input floating value nan, which is part of the collection [nan, 1.0] to the "
+            "requested type (float32). The value does not fit into the requested numpy datatype which can only "
+            "accommodate values between",
+        ),
+        (
+            {
+                "python_converter": PythonDataConverter(
+                    numeric_converter=NumericConverter(allow_integer_output=False), raise_errors=True
+                ),
+                "output_bit_width": "auto",
+            },
+            [1.0, float("nan")],
+            OverflowError,
+            "Unable to find a supported numpy datatype to represent the input floating value nan as the value is too "
+            "large.",
+        ),
         # Tests using floats with 8-bit output width configuration
         (
             {
@@ -1229,9 +1474,11 @@ def test_numpy_data_converter_convert_value_to_numpy_errors(
 
     Evaluates the following scenarios:
         0 - Raising OverflowError for signed integer overflow.
-        1 - Raising OverflowError for unsigned integer overflow.
-        2 - Raising OverflowError for float overflow.
-        3 - Raising ValueError for floating-point conversion with 8-bit output width configuration.
+        1 - Raising OverflowError for an iterable element signed integer overflow.
+        2 - Raising OverflowError for unsigned integer overflow.
+        3 - Raising OverflowError for float overflow.
+        4-6 - Raising OverflowError for iterables that contain nan values (fixed and auto bit width).
+        7 - Raising ValueError for floating-point conversion with 8-bit output width configuration.
     """
     converter = NumpyDataConverter(**config)
     with pytest.raises(expected_error, match=error_format(expected_message)):
@@ -1402,6 +1649,12 @@ def test_numpy_data_converter_convert_value_to_numpy_errors(
             np.array([42], dtype=np.int32),
             42,
         ),
+        # Test with a numpy array that contains inf and nan values
+        (
+            {"python_converter": PythonDataConverter(none_converter=NoneConverter(), raise_errors=True)},
+            np.array([np.nan, np.inf, -np.inf], dtype=np.float64),
+            (None, None, None),
+        ),
     ],
 )
 def test_numpy_data_converter_convert_value_from_numpy(config, input_value, expected_value) -> None:
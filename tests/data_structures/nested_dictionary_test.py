@@ -362,6 +362,28 @@ def test_extract_nested_variable_paths(nested_dict: dict, return_raw: bool, expe
     assert len(result) == len(expected_output)  # Ensures no extra or missing paths
 
 
+def test_extract_nested_variable_paths_tracks_changes():
+    """Verifies that NestedDictionary extract_nested_variable_paths() method reflects all dictionary modifications."""
+    seed = {"a": {"b": 1}}
+    nd = NestedDictionary(seed)
+    assert nd.extract_nested_variable_paths(return_raw=True) == (("a", "b"),)
+
+    # Modifications made through the seed dictionary and the sub-dictionaries returned by read_nested_value() are
+    # reflected by the extracted paths
+    seed["z"] = 2
+    nd.read_nested_value("a")["q"] = 3
+    assert nd.extract_nested_variable_paths() == ("a.b", "a.q", "z")
+
+    # Modifications made through class methods are also reflected by the extracted paths
+    nd.write_nested_value("a.c", 2, modify_class_dictionary=True)
+    assert set(nd.extract_nested_variable_paths()) == {"a.b", "a.q", "a.c", "z"}
+    nd.delete_nested_value("a.b", modify_class_dictionary=True)
+    assert set(nd.extract_nested_variable_paths()) == {"a.q", "a.c", "z"}
+    nd.write_nested_value("1.d", 3, modify_class_dictionary=True)
+    nd.convert_all_keys_to_datatype(datatype="str", modify_class_dictionary=True)
+    assert set(nd.extract_nested_variable_paths(return_raw=True)) == {("a", "q"), ("a", "c"), ("z",), ("1", "d")}
+
+
 @pytest.mark.parametrize(
     "key, datatype, expected_result",
     [
@@ -737,6 +759,23 @@ def test_write_nested_value(
         assert result._nested_dictionary == expected_dict
 
 
+def test_write_nested_value_copy_independence():
+    """Verifies that write_nested_value() does not share mutable values between the original and the modified
+    dictionaries when modify_class_dictionary is False.
+    """
+    seed = {"a": [1, 2], "b": {"c": {3}, "d": np.array([4, 5])}}
+    nd = NestedDictionary(seed)
+    result = nd.write_nested_value("e", 6, modify_class_dictionary=False)
+
+    # Modifies the mutable values of the returned dictionary and verifies the original dictionary is not affected
+    result._nested_dictionary["a"].append(3)
+    result._nested_dictionary["b"]["c"].add(4)
+    result._nested_dictionary["b"]["d"][0] = 0
+    assert nd._nested_dictionary["a"] == [1, 2]
+    assert nd._nested_dictionary["b"]["c"] == {3}
+    assert nd._nested_dictionary["b"]["d"][0] == 4
+
+
 def test_write_nested_value_error():
     """Verifies the error-handling behavior of NestedDictionary class write_nested_value() method."""
 
@@ -1,6 +1,8 @@
+import gc
 import re
 from typing import Optional
 from pathlib import Path
+import weakref
 import textwrap
 from dataclasses import field, dataclass
 
@@ -8,6 +10,7 @@ import yaml
 import pytest
 
 from ataraxis_data_structures import YamlConfig
+from ataraxis_data_structures.data_structures.yaml_config import _field_names
 
 
 def error_format(message: str) -> str:
@@ -168,3 +171,71 @@ def test_yaml_config_subclassing():
     # Test that the subclass still has the to_yaml and from_yaml methods
     assert hasattr(config, "to_yaml")
     assert hasattr(ExtendedConfig, "from_yaml")
+
+
+def test_yaml_config_nested_round_trip(tmp_path):
+    """Verifies that YamlConfig classes with nested dataclass fields are saved and loaded correctly."""
+
+    @dataclass
+    class InnerConfig:
+        value: int = 1
+        items: list = field(default_factory=lambda: [1, 2])
+
+    @dataclass
+    class OuterConfig(YamlConfig):
+        inner: InnerConfig = field(default_factory=InnerConfig)
+        mapping: dict = field(default_factory=lambda: {"key": [3, 4]})
+
+    config = OuterConfig(inner=InnerConfig(value=5, items=[7]))
+    full_path = tmp_path.joinpath("nested_config.yaml")
+
+    # Saves the config twice to verify that cached field names are reused correctly
+    config.to_yaml(full_path)
+    config.to_yaml(full_path)
+
+    with open(full_path, "r") as file_data:
+        assert yaml.safe_load(file_data) == {"inner": {"value": 5, "items": [7]}, "mapping": {"key": [3, 4]}}
+
+    loaded_config = OuterConfig.from_yaml(full_path)
+    assert loaded_config == config
+
+
+def test_yaml_config_field_names_cache(tmp_path):
+    """Verifies that caching the dataclass field names does not prevent the dataclasses from being garbage-collected."""
+
+    @dataclass
+    class LocalConfig(YamlConfig):
+        value: int = 1
+
+    LocalConfig().to_yaml(tmp_path.joinpath("local_config.yaml"))
+    assert LocalConfig in _field_names
+
+    # Deleting the only strong reference to the class also removes it from the cache
+    class_reference = weakref.ref(LocalConfig)
+    del LocalConfig
+    gc.collect()
+    assert class_reference() is None
+
+
+def test_yaml_config_shared_values(tmp_path):
+    """Verifies that values shared by multiple YamlConfig fields are written out for each field, without YAML anchors
+    and aliases.
+    """
+
+    @dataclass
+    class SharedConfig(YamlConfig):
+        first: set = field(default_factory=set)
+        second: set = field(default_factory=set)
+
+    shared = {1, 2}
+    config = SharedConfig(first=shared, second=shared)
+    full_path = tmp_path.joinpath("shared_config.yaml")
+    config.to_yaml(full_path)
+
+    content = full_path.read_text()
+    assert "&" not in content and "*" not in content
+    with open(full_path, "r") as file_data:
+        assert yaml.safe_load(file_data) == {"first": {1, 2}, "second": {1, 2}}
+
+    # Serialization does not modify the original values
+    assert config.first is shared and config.second is shared
@@ -103,6 +103,8 @@ def test_repr(int_array):
         ("int_array", "test_read_data_int_8", (0, 3), False, np.array([1, 2, 3]), np.ndarray),
         ("int_array", "test_read_data_int_9", (1,), False, np.array([2, 3, 4, 5]), np.ndarray),
         ("int_array", "test_read_data_int_10", (-3, -1), False, np.array([3, 4]), np.ndarray),
+        ("int_array", "test_read_data_int_11", True, False, 2, np.int32),
+        ("int_array", "test_read_data_int_12", False, True, 1, int),
         # Float array tests
         ("float_array", "test_read_data_float_1", 0, True, 1.1, float),
         ("float_array", "test_read_data_float_2", -1, True, 5.5, float),
@@ -148,6 +150,7 @@ def test_read_data(request, array_fixture, buffer_name, index, convert, expected
     Tested configurations:
         - Reading data at various indices (positive, negative, single, slices)
         - Reading from different data types (int32, float64, bool, string)
+        - Reading data at boolean indices, which are treated as integer indices (True is 1, False is 0)
         - Testing both converted and non-converted outputs
         - Verifying correct return types for all scenarios
     """
@@ -186,6 +189,8 @@ def test_read_data(request, array_fixture, buffer_name, index, convert, expected
         ("int_array", "test_write_data_int_5", (-3, -1), [30, 40], [30, 40]),
         ("int_array", "test_write_data_int_6", 0, np.int32(15), 15),
         ("int_array", "test_write_data_int_7", (0, 5), np.array([1, 2, 3, 4, 5]), [1, 2, 3, 4, 5]),
+        ("int_array", "test_write_data_int_8", (0, 2), np.array([6.0, 7.0], dtype=np.float64), [6, 7]),
+        ("int_array", "test_write_data_int_9", True, 20, 20),
         # Float array tests
         ("float_array", "test_write_data_float_1", 0, 10.5, 10.5),
         ("float_array", "test_write_data_float_2", -1, 50.5, 50.5),
@@ -240,6 +245,7 @@ def test_write_data(request, array_fixture, buffer_name, index, data, expected):
     Tested configurations:
         - Writing data at various indices (positive, negative, single, slices)
         - Writing to different data types (int32, float64, bool, string)
+        - Writing data at boolean indices, which are treated as integer indices (True is 1, False is 0)
         - Writing single values and lists/arrays of values
         - Writing using Python native types and numpy types
         - Verifying correct data writing for all scenarios
@@ -569,3 +575,352 @@ def test_cross_process_concurrent_access():
     for p in processes:
         p.join()
     assert np.all(sma.read_data((0, 5)) == 100)
+
+
+def consistency_worker(sma: SharedMemoryArray):
+    """This worker is used to verify that locked reads never observe partially written data.
+
+    Specifically, it is used as part of the cross_process_consistent_read() test task. The worker repeatedly overwrites
+    the whole array with a single value, so that any consistent read of the array returns identical elements.
+    """
+    sma.connect()
+    for value in range(1, 1001):
+        sma.write_data((0,), np.full(sma.shape, value, dtype=sma.datatype))
+    sma.disconnect()
+
+
+@pytest.mark.xdist_group("cross_process")
+def test_cross_process_consistent_read():
+    """Verifies that locked reads from the SharedMemoryArray class are consistent with concurrent locked writes.
+
+    Tested configurations:
+        - 0: Reading the whole array from the parent process while a child process repeatedly overwrites it
+    """
+    sma = SharedMemoryArray.create_array("test_consistent_read", np.zeros(10000, dtype=np.int64))
+
+    p = Process(target=consistency_worker, args=(sma,))
+    p.start()
+    while p.is_alive():
+        data = sma.read_data((0,))
+        assert np.all(data == data[0])
+    p.join()
+
+    np.testing.assert_array_equal(sma.read_data((0,)), np.full(10000, 1000))
+
+
+def test_read_data_lock_fallback(int_array):
+    """Verifies that the SharedMemoryArray class read_data() method falls back to acquiring the Lock when optimistic
+    reads fail.
+
+    Tested configurations:
+        - 0: Reading data after exhausting all optimistic read attempts
+    """
+    sma = SharedMemoryArray.create_array("test_read_lock_fallback", int_array)
+
+    # Disables optimistic reads, forcing the method to copy the data under the Lock
+    sma._max_read_attempts = 0
+    np.testing.assert_array_equal(sma.read_data((0,)), int_array)
+    assert sma.read_data(2) == 3
+
+
+class CountingLock:
+    """Wraps the multiprocessing Lock used by the tests below and counts how many times it was acquired."""
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.count = 0
+
+    def __enter__(self):
+        self.count += 1
+        return self.lock.__enter__()
+
+    def __exit__(self, *args):
+        return self.lock.__exit__(*args)
+
+
+def test_read_data_weakly_ordered(int_array):
+    """Verifies that the SharedMemoryArray class read_data() method copies the data under the Lock on weakly-ordered
+    processors.
+
+    Tested configurations:
+        - 0: Reading a slice when the seqlock is disabled
+        - 1: Reading a slice when the seqlock is enabled
+    """
+    sma = SharedMemoryArray.create_array("test_read_weakly_ordered", int_array)
+    lock = CountingLock(sma._lock)
+    sma._lock = lock
+
+    # Simulates a weakly-ordered processor, where the data has to be read under the Lock
+    sma._lock_free_reads = False
+    np.testing.assert_array_equal(sma.read_data((0,)), int_array)
+    assert lock.count == 1
+
+    # On strongly-ordered processors, reads use the seqlock and do not acquire the Lock
+    sma._lock_free_reads = True
+    np.testing.assert_array_equal(sma.read_data((0,)), int_array)
+    assert lock.count == 1
+
+    sma._lock = lock.lock
+    sma.disconnect()
+    sma.destroy()
+
+
+def test_read_data_unlocked(int_array):
+    """Verifies that the SharedMemoryArray class read_data() method only skips the consistency checks for single
+    elements when it is explicitly requested.
+
+    Tested configurations:
+        - 0: Reading single elements with the lock while a write is in progress
+        - 1: Reading single elements without the lock while a write is in progress
+    """
+    sma = SharedMemoryArray.create_array("test_read_data_unlocked", int_array)
+    lock = CountingLock(sma._lock)
+    sma._lock = lock
+
+    # Simulates a write in progress. Locked reads of single elements use the seqlock and, since the version never
+    # becomes even, fall back to acquiring the Lock.
+    sma._version[0] = 1
+    assert sma.read_data(2) == 3
+    assert sma.read_data(-1, convert_output=True) == 5
+    assert lock.count == 2
+
+    # Unlocked reads neither retry nor acquire the Lock
+    assert sma.read_data(2, with_lock=False) == 3
+    assert sma.read_data(-1, convert_output=True, with_lock=False) == 5
+    assert lock.count == 2
+    sma._version[0] = 0
+
+    sma._lock = lock.lock
+    sma.disconnect()
+    sma.destroy()
+
+
+def test_read_data_out(int_array):
+    """Verifies the functionality of the SharedMemoryArray class read_data() method 'out' argument.
+
+    Tested configurations:
+        - 0: Reading a slice into a pre-allocated array, with and without the lock
+        - 1: Reading a single-element slice into a pre-allocated array
+        - 2: Reading a slice into a pre-allocated array and converting the output
+        - 3: Providing an incompatible 'out' array
+    """
+    sma = SharedMemoryArray.create_array("test_read_data_out", int_array)
+
+    out = np.empty(3, dtype=np.int32)
+    assert sma.read_data((1, 4), out=out) is out
+    np.testing.assert_array_equal(out, [2, 3, 4])
+    assert sma.read_data((2,), out=out, with_lock=False) is out
+    np.testing.assert_array_equal(out, [3, 4, 5])
+
+    single = np.empty(1, dtype=np.int32)
+    assert sma.read_data((4,), out=single) is single
+    assert single[0] == 5
+
+    assert sma.read_data((0, 3), out=out, convert_output=True) == [1, 2, 3]
+
+    invalid_out = np.empty(3, dtype=np.int64)
+    message = (
+        "Unable to read data from test_read_data_out SharedMemoryArray class instance into the provided 'out' "
+        "array. Expected a numpy ndarray with shape (2,) and datatype int32, but encountered ndarray with shape (3,) "
+        "and datatype int64 instead."
+    )
+    with pytest.raises(ValueError, match=error_format(message)):
+        sma.read_data((0, 2), out=invalid_out)
+
+
+@pytest.mark.parametrize(
+    "prototype, buffer_name",
+    [
+        (np.array([1, -2, 3], dtype=np.int8), "test_typed_view_int8"),
+        (np.array([1, 2, 2**63], dtype=np.uint64), "test_typed_view_uint64"),
+        (np.array([1.5, 2.25, 3.125], dtype=np.float32), "test_typed_view_float32"),
+        (np.array([True, False, True], dtype=np.bool_), "test_typed_view_bool"),
+        (np.array([1.5, 2.5, 3.5], dtype=np.float16), "test_typed_view_float16"),
+        (np.array([1, -2, 3], dtype=">i4"), "test_typed_view_big_endian"),
+        (np.array(["2024-01-01", "2024-06-15", "2025-01-01"], dtype="datetime64[D]"), "test_typed_view_datetime"),
+        (np.arange(6, dtype=np.int16)[::2], "test_typed_view_strided"),
+    ],
+)
+def test_read_data_typed_view(prototype, buffer_name):
+    """Verifies that converted single-element reads return the same Python objects regardless of whether the array
+    datatype supports typed memoryview access.
+
+    Tested configurations:
+        - Reading converted elements from arrays with (int8, uint64, float32, bool) and without (float16,
+          big-endian int32, datetime64) typed memoryview support
+        - Creating the array from a non-contiguous (strided) prototype
+        - Pickling and disconnecting the array with the typed memoryview
+    """
+    sma = SharedMemoryArray.create_array(buffer_name, prototype)
+    for index in range(-3, 3):
+        result = sma.read_data(index, convert_output=True)
+        assert result == prototype[index].item()
+        assert type(result) is type(prototype[index].item())
+
+    # Verifies that the (unpicklable) typed memoryview is excluded from the state used to pickle the instance
+    assert sma.__getstate__()["_typed_view"] is None
+
+    sma.disconnect()
+    sma.destroy()
+
+
+def test_connect_reuse(int_array):
+    """Verifies that the SharedMemoryArray class connect() method reuses the existing connection and buffer handle.
+
+    Tested configurations:
+        - 0: Connecting an already connected array
+        - 1: Reconnecting the array after disconnecting it
+        - 2: Excluding the buffer views from the pickled instance state
+    """
+    sma = SharedMemoryArray.create_array("test_connect_reuse", int_array)
+    buffer = sma._buffer
+    array = sma._array
+
+    # Connecting an already connected instance does not re-open the buffer or re-create the array
+    sma.connect()
+    assert sma._buffer is buffer
+    assert sma._array is array
+
+    # The buffer views are not pickled, so unpickled instances have to connect to the buffer
+    state = sma.__getstate__()
+    assert state["_array"] is None and state["_version"] is None and state["_typed_view"] is None
+
+    # Reconnecting after disconnecting opens a new buffer handle
+    sma.write_data(0, 10)
+    sma.disconnect()
+    sma.connect()
+    assert sma._buffer is not buffer
+    assert sma.read_data(0) == 10
+
+    sma.disconnect()
+    sma.destroy()
+
+
+def test_read_write_batch(int_array):
+    """Verifies the functionality of the SharedMemoryArray class read_batch() and write_batch() methods.
+
+    Tested configurations:
+        - 0: Reading scattered (including negative and repeated) indices, with and without the lock
+        - 1: Reading with a numpy index array and converting the output
+        - 2: Reading with an empty index collection
+        - 3: Writing a sequence and a scalar to scattered indices
+    """
+    sma = SharedMemoryArray.create_array("test_read_write_batch", int_array)
+
+    result = sma.read_batch([4, 0, -2, 0])
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == int_array.dtype
+    np.testing.assert_array_equal(result, [5, 1, 4, 1])
+    np.testing.assert_array_equal(sma.read_batch((1, 3), with_lock=False), [2, 4])
+
+    assert sma.read_batch(np.array([2, 1], dtype=np.uint8), convert_output=True) == [3, 2]
+    assert sma.read_batch([]).size == 0
+
+    sma.write_batch([0, -1], [10, 50])
+    sma.write_batch(np.array([1, 3]), 7, with_lock=False)
+    np.testing.assert_array_equal(sma.read_data((0,)), [10, 7, 3, 7, 50])
+
+    # Verifies that the batch methods do not modify the shared data through the returned arrays
+    result[0] = 100
+    assert sma.read_data(4) == 50
+
+    sma.disconnect()
+    sma.destroy()
+
+
+def test_read_write_batch_errors(int_array):
+    """Verifies the error handling of the SharedMemoryArray class read_batch() and write_batch() methods."""
+    sma = SharedMemoryArray.create_array("test_read_write_batch_errors", int_array)
+
+    # Invalid index collection shape and datatype
+    for indices, shape, dtype in (
+        (np.array([[0, 1]], dtype=np.int64), (1, 2), "int64"),
+        ([0.5, 1.0], (2,), "float64"),
+    ):
+        message = (
+            f"Unable to access the data of the test_read_write_batch_errors SharedMemoryArray class instance using "
+            f"batch indices. Expected a one-dimensional collection of integer indices, but encountered an array with "
+            f"shape {shape} and datatype {dtype} instead."
+        )
+        with pytest.raises(ValueError, match=error_format(message)):
+            sma.read_batch(indices)
+
+    # Out-of-bounds indices
+    for index in (5, -6):
+        message = (
+            f"Unable to retrieve the data from test_read_write_batch_errors SharedMemoryArray class instance using "
+            f"batch indices. The index {index} is outside the valid index range (-5:4)."
+        )
+        with pytest.raises(IndexError, match=error_format(message)):
+            sma.write_batch([0, index], 1)
+
+    # Data that cannot be written to the requested indices
+    message = (
+        "Unable write data to test_read_write_batch_errors SharedMemoryArray class instance with index (0, 1). "
+        "Encountered the following error when converting the data to the array datatype (int32) and writing it to "
+        "the array:"
+    )
+    with pytest.raises(ValueError, match=error_format(message)):
+        sma.write_batch([0, 1], [1, 2, 3])
+    with pytest.raises(ValueError, match=error_format(message)):
+        sma.write_batch([0, 1], ["a", "b"])
+
+    # Disconnected instance
+    sma.disconnect()
+    message = (
+        "Unable to access the data stored in the test_read_write_batch_errors SharedMemoryArray instance, as the "
+        "class is not connected to the shared memory buffer. Use connect() method prior to calling other class "
+        "methods."
+    )
+    with pytest.raises(RuntimeError, match=error_format(message)):
+        sma.read_batch([0])
+    with pytest.raises(RuntimeError, match=error_format(message)):
+        sma.write_batch([0], 1)
+    sma.destroy()
+
+
+def test_create_array_group():
+    """Verifies the functionality of the SharedMemoryArray class create_array_group() method.
+
+    Tested configurations:
+        - 0: Creating a group of arrays that use different datatypes
+        - 1: Accessing each group array independently
+        - 2: Releasing the already created arrays when creating a group array fails
+    """
+    prototypes = {
+        "flag": np.zeros(1, dtype=np.bool_),
+        "timestamp": np.array([1.5], dtype=np.float64),
+        "counter": np.array([0, 0], dtype=np.uint32),
+    }
+    group = SharedMemoryArray.create_array_group("test_array_group", prototypes)
+
+    assert list(group) == ["flag", "timestamp", "counter"]
+    for field, prototype in prototypes.items():
+        assert group[field].name == f"test_array_group_{field}"
+        assert group[field].datatype == prototype.dtype
+        np.testing.assert_array_equal(group[field].read_data((0,)), prototype)
+
+    group["flag"].write_data(0, True)
+    group["counter"].write_data(1, 5)
+    assert group["flag"].read_data(0) is np.True_
+    np.testing.assert_array_equal(group["counter"].read_data((0,)), [0, 5])
+    assert group["timestamp"].read_data(0) == 1.5
+
+    # Reusing the 'timestamp' buffer name makes the group creation fail after the 'flag' array is created.
+    message = (
+        "Unable to create SharedMemoryArray object using name 'test_array_group_timestamp', as object with this name "
+        "already exists."
+    )
+    with pytest.raises(FileExistsError, match=error_format(message)):
+        SharedMemoryArray.create_array_group(
+            "test_array_group", {"extra": np.zeros(1, dtype=np.int8), "timestamp": np.zeros(1)}
+        )
+
+    # Verifies that the 'extra' array created before the failure was destroyed
+    extra = SharedMemoryArray.create_array("test_array_group_extra", np.zeros(1, dtype=np.int8))
+    extra.disconnect()
+    extra.destroy()
+
+    for shared_memory_array in group.values():
+        shared_memory_array.disconnect()
+        shared_memory_array.destroy()